@@ -12,7 +12,7 @@ WORDPRESS_LANGUAGE = "en-US"
 
 # Image settings
 IMAGE_DOWNLOAD_TIMEOUT = 30
-IMAGE_CHUNK_SIZE = 8192
+IMAGE_CHUNK_SIZE = 1 << 20  # 1 MiB
 
 # Logging settings
 LOG_LEVEL = "INFO"  # DEBUG, INFO, WARNING, ERROR
@@ -37,7 +37,8 @@ CUSTOM_TAGS = [
 ]
 
 # URL patterns to replace in content
-# Format: (pattern, replacement)
+# Format: (pattern, replacement) - literal strings, applied to every link in one pass
+# Pass to MediumToWordPressConverter(..., url_replacements=URL_REPLACEMENTS)
 URL_REPLACEMENTS = [
     # Example: Replace old domain with new domain
     # ("old-domain.com", "new-domain.com"),
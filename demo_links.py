@@ -4,7 +4,7 @@ Demo script showing the improved link processing capabilities
 """
 
 from medium_to_wordpress_optimized import MediumToWordPressConverter
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
 
 def demo_link_processing():
     """Demonstrate the link processing improvements."""
@@ -23,11 +23,13 @@ def demo_link_processing():
         "devops-best-practices-123abc456def"
     ]
     
-    for slug in test_slugs:
-        clean_slug = converter.clean_medium_post_slug(slug)
-        print(f"   {slug}")
-        print(f"   → {clean_slug}")
-        print()
+    clean_slugs = converter.clean_medium_post_slugs(test_slugs)
+    lines = []
+    for slug, clean_slug in zip(test_slugs, clean_slugs):
+        lines.append(f"   {slug}")
+        lines.append(f"   → {clean_slug}")
+        lines.append("")
+    converter.report(lines)
     
     # Test link processing
     print("2. 🌐 Link Processing:")
@@ -40,19 +42,30 @@ def demo_link_processing():
     </div>
     """
     
-    soup = BeautifulSoup(sample_html, 'html.parser')
+    # Only build the tree for the wrapper div and its links
+    only_links = SoupStrainer(['a', 'div'])
+    
+    # Prefer the C-based lxml parser, fall back to the built-in one
+    try:
+        soup = BeautifulSoup(sample_html, 'lxml', parse_only=only_links)
+    except FeatureNotFound:
+        soup = BeautifulSoup(sample_html, 'html.parser', parse_only=only_links)
     div_element = soup.find('div')
     
-    print("   Before processing:")
-    for link in div_element.find_all('a'):
-        print(f"   - {link.get('href')}")
+    print(f"   Parser: {soup.builder.NAME}")
+    # Collect the links once and reuse them for every pass
+    anchors = div_element.find_all('a')
+    
+    lines = ["   Before processing:"]
+    lines.extend(f"   - {link.get('href')}" for link in anchors)
+    converter.report(lines)
     
     # Process the links
-    converter.process_links_in_element(div_element, "marius-schroeder.de")
+    converter.process_links_in_element(div_element, "marius-schroeder.de", anchors=anchors)
     
-    print("\n   After processing:")
-    for link in div_element.find_all('a'):
-        print(f"   - {link.get('href')}")
+    lines = ["\n   After processing:"]
+    lines.extend(f"   - {link.get('href')}" for link in anchors)
+    converter.report(lines)
     
     print("\n✅ Demo completed! As you can see:")
     print("   • Medium hash IDs are removed")
@@ -13,26 +13,107 @@ import os
 import re
 import sys
 import html
+from copy import copy
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from urllib.parse import urlparse
 from pathlib import Path
 import argparse
 import logging
 
+# Gemeinsame HTTP-Session für alle Bild-Downloads (Keep-Alive und Connection-Pool)
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': 'medium-to-wp/1.0'})
+_SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                                       max_retries=Retry(total=3, backoff_factor=0.3)))
+
+# Medium-spezifische Attribute, die beim Bereinigen entfernt werden
+_STRIP_ATTRS = frozenset({
+    'data-action', 'data-action-type', 'data-action-value', 'data-anchor-type',
+    'data-user-id', 'class', 'id', 'name', 'data-href'
+})
+
+# Alle Content-Elemente in Dokumentreihenfolge (XPath wird einmal kompiliert)
+_CONTENT_XPATH = etree.XPath(
+    './/*[self::p or self::h1 or self::h2 or self::h3 or self::h4 or self::h5 or self::h6'
+    ' or self::figure or self::blockquote or self::pre or self::ul or self::ol or self::hr]'
+)
+
+# Vorkompilierte reguläre Ausdrücke
+_TAG_RE = re.compile(r'<[^>]+>')
+_NONSLUG_RE = re.compile(r'[^\w\s-]')
+_DASH_RE = re.compile(r'[-\s]+')
+_HREF_QUOTE_RE = re.compile(r'href=(?:"([^"]+)"|\'([^\']+)\')')
+_DATE_RE = re.compile(r'^(\d{4}-\d{2}-\d{2})_')
+_FILENAME_BAD_RE = re.compile(r'[*<>:"/\\|?]')
+_WORD_RE = re.compile(r'\b\w+\b')
+_MEDIUM_ME_RE = re.compile(r'/@mariusschroeder/([^?]+)')
+_MEDIUM_ML_RE = re.compile(r'/medialesson/([^?]+)')
+
+# Kategorie-Mapping basierend auf Schlüsselwörtern
+_CATEGORY_KEYWORDS = {
+    'WEB DEVELOPMENT': ['angular', 'react', 'vue', 'javascript', 'typescript', 'html', 'css', 'web', 'frontend', 'backend', 'blazor', 'asp.net', 'mvc'],
+    '.NET': ['.net', 'c#', 'csharp', 'asp.net', 'entity framework', 'blazor', 'mvc', 'web api', 'dotnet'],
+    'DEVOPS': ['docker', 'kubernetes', 'azure', 'aws', 'deployment', 'ci/cd', 'pipeline', 'devops', 'terraform'],
+    'PROGRAMMING': ['code', 'programming', 'development', 'software', 'algorithm', 'design pattern', 'best practices'],
+    'CLOUD': ['azure', 'aws', 'cloud', 'serverless', 'microservices', 'container'],
+    'MOBILE': ['ionic', 'xamarin', 'mobile', 'android', 'ios', 'app development'],
+    'TUTORIAL': ['tutorial', 'guide', 'how to', 'step by step', 'getting started', 'introduction']
+}
+
+# Tags basierend auf spezifischen Technologien
+_TAG_KEYWORDS = [
+    'angular', 'react', 'vue', 'javascript', 'typescript', 'html', 'css', 'sass', 'scss',
+    '.net', 'c#', 'asp.net', 'blazor', 'mvc', 'web api', 'entity framework',
+    'docker', 'kubernetes', 'azure', 'aws', 'git', 'github', 'visual studio',
+    'npm', 'node.js', 'webpack', 'vite', 'ionic', 'xamarin', 'sql', 'database',
+    'api', 'rest', 'graphql', 'json', 'xml', 'microservices', 'architecture',
+    'testing', 'unit testing', 'integration testing', 'debugging', 'performance',
+    'security', 'authentication', 'authorization', 'oauth', 'jwt'
+]
+
+# Invertierter Index: Schlüsselwort → Kategorien
+_KEYWORD_TO_CATS = {
+    keyword: [category for category, keywords in _CATEGORY_KEYWORDS.items() if keyword in keywords]
+    for keywords in _CATEGORY_KEYWORDS.values() for keyword in keywords
+}
+
+# Schlüsselwörter, die keine einfachen Wörter sind (z.B. 'asp.net', 'web api'),
+# werden mit einem einzigen Regex gesucht; der Lookahead findet auch überlappende Treffer
+_ALL_KEYWORDS = set(_TAG_KEYWORDS).union(_KEYWORD_TO_CATS)
+_KEYWORD_PHRASES = sorted((k for k in _ALL_KEYWORDS if not _WORD_RE.fullmatch(k)), key=len, reverse=True)
+# Phrasen dürfen nicht mitten in einem Wort beginnen oder enden (z.B. 'how to' in 'somehow')
+_KEYWORD_PHRASE_RE = re.compile('(?=(' + '|'.join(
+    (r'(?<!\w)' if _WORD_RE.match(k[0]) else '') + re.escape(k) + (r'(?!\w)' if _WORD_RE.match(k[-1]) else '')
+    for k in _KEYWORD_PHRASES) + '))')
+
 # Funktion zum Herunterladen und Speichern von Bildern
-def download_image(url, save_path):
-    """Lädt ein Bild herunter und speichert es lokal."""
+def download_image(url, save_path, force=False):
+    """Lädt ein Bild herunter und speichert es lokal (vorhandene Bilder werden übersprungen)."""
+    # Bereits heruntergeladene Bilder nicht erneut laden, außer es wird erzwungen
+    if not force and os.path.exists(save_path) and os.path.getsize(save_path) > 0:
+        return True
+    # In eine temporäre Datei laden, damit abgebrochene Downloads nie als fertig gelten
+    part_path = f"{save_path}.part"
     try:
-        response = requests.get(url, stream=True)
+        response = _SESSION.get(url, stream=True, timeout=30)
         response.raise_for_status()
-        with open(save_path, 'wb') as f:
+        with open(part_path, 'wb') as f:
             for chunk in response.iter_content(chunk_size=8192):
                 f.write(chunk)
+        os.replace(part_path, save_path)
         return True
     except Exception as e:
         print(f"❌ Fehler beim Herunterladen von {url}: {e}")
+        if os.path.exists(part_path):
+            os.remove(part_path)
         return False
 
 # Funktion zum Extrahieren eines Bildnamens aus einer URL
@@ -47,168 +128,178 @@ def get_image_filename(image_url, post_slug):
         original_filename = f"image_{url_hash}.jpg"
     
     # Entferne URL-unfreundliche Zeichen wie Sterne
-    original_filename = re.sub(r'[*<>:"/\\|?]', '', original_filename)
+    original_filename = _FILENAME_BAD_RE.sub('', original_filename)
     
     # Füge Post-Slug als Präfix hinzu für Eindeutigkeit
     name, ext = os.path.splitext(original_filename)
     return f"{post_slug}_{name}{ext}"
 
-# Funktion zum Erstellen eines URL-freundlichen Slugs
+# Funktion zum Erstellen eines URL-freundlichen Slugs (Ergebnis wird pro Titel gecacht)
+@lru_cache(maxsize=4096)
 def create_slug(title):
     """Erstellt einen URL-freundlichen Slug aus dem Titel."""
     # Entferne HTML-Tags falls vorhanden
-    clean_title = re.sub(r'<[^>]+>', '', title)
+    clean_title = _TAG_RE.sub('', title)
     # Ersetze Sonderzeichen und Leerzeichen, aber behalte Groß-/Kleinschreibung
-    slug = re.sub(r'[^\w\s-]', '', clean_title)
-    slug = re.sub(r'[-\s]+', '-', slug)
+    slug = _NONSLUG_RE.sub('', clean_title)
+    slug = _DASH_RE.sub('-', slug)
     return slug.strip('-').lower()  # Nur für nicename lowercase verwenden
 
 # Funktion zum Bereinigen von HTML-Elementen (entfernt Medium-spezifische Klassen)
 def clean_html_content(element):
     """Bereinigt HTML-Inhalt von Medium-spezifischen Attributen und Klassen."""
-    # Erstelle eine Kopie des Elements
-    soup = BeautifulSoup(str(element), 'html.parser')
-    
-    # Entferne alle class-Attribute von allen Elementen
-    for tag in soup.find_all(True):
-        if tag.has_attr('class'):
-            del tag['class']
-        # Entferne auch andere Medium-spezifische Attribute
-        for attr in ['data-action', 'data-action-type', 'data-action-value', 'data-anchor-type', 
-                     'data-user-id', 'id', 'name']:
-            if tag.has_attr(attr):
-                del tag[attr]
+    # Erstelle eine Kopie des Elements (ohne Serialisieren und erneutes Parsen)
+    soup = copy(element)
+    
+    # Entferne alle class-Attribute von allen Elementen (inklusive des Elements selbst)
+    # und auch andere Medium-spezifische Attribute
+    for tag in [soup] + soup.find_all(True):
+        for attr in _STRIP_ATTRS:
+            tag.attrs.pop(attr, None)
     
     return soup
 
+# Hilfsfunktion zum Serialisieren des Inhalts eines lxml-Elements
+def _inner_html(element):
+    """Gibt das innere HTML eines Elements zurück (ohne das Element selbst)."""
+    parts = [html.escape(element.text, quote=False)] if element.text else []
+    parts.extend(lxml.html.tostring(child, encoding='unicode') for child in element)
+    return ''.join(parts)
+
 # Funktion zum Extrahieren und Verarbeiten des eigentlichen Inhalts
-def process_content_simple(content_html, post_slug, images_dir, base_url):
+def process_content_simple(content_html, post_slug, images_dir, base_url, force_download=False):
     """Extrahiert sauberen HTML-Inhalt aus dem Medium-Format."""
-    soup = BeautifulSoup(content_html, 'html.parser')
+    # Leerer Inhalt ergibt keinen Beitragstext (lxml lehnt leere Dokumente ab)
+    if not content_html or not content_html.strip():
+        return ''
+    # In ein <div> einbetten, damit auch ein einzelnes Wurzelelement von der XPath-Abfrage gefunden wird
+    tree = lxml.html.fragment_fromstring(content_html, create_parent='div')
+    
+    # WordPress-kompatibler Upload-Pfad mit Jahr/Monat, einmal pro Post ermittelt
+    now = datetime.now()
+    current_year = now.year
+    current_month = now.strftime('%m')
     
     # Sammle alle relevanten Content-Elemente in der richtigen Reihenfolge
     content_parts = []
+    # Herunterzuladende Bilder: (Index in content_parts, URL, Dateiname, Pfad, Figure-Anfang)
+    downloads = []
     
-    # Finde alle Content-Elemente
-    for element in soup.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'figure', 'blockquote', 'pre', 'ul', 'ol', 'hr']):
-        if element.name == 'figure':
+    # Finde alle Content-Elemente mit einer einzigen XPath-Abfrage
+    for element in _CONTENT_XPATH(tree):
+        if element.tag == 'figure':
             # Behandle Bilder
-            img_tag = element.find('img')
-            if img_tag:
+            img_tag = next(element.iter('img'), None)
+            if img_tag is not None:
                 src = img_tag.get('src')
-                if src and 'medium.com' in src:
-                    # Erstelle Bildnamen und lade Bild herunter
-                    image_filename = get_image_filename(src, post_slug)
-                    image_path = os.path.join(images_dir, image_filename)
-                    
-                    if download_image(src, image_path):
-                        # Erstelle WordPress-kompatiblen Bildpfad mit Jahr/Monat
-                        current_year = datetime.now().year
-                        current_month = datetime.now().strftime('%m')
-                        # Ändere Dateiendung zu .webp
-                        base_name = os.path.splitext(image_filename)[0]
-                        webp_filename = f"{base_name}.webp"
-                        src = f"/wp-content/uploads/{current_year}/{current_month}/{webp_filename}"
-                        print(f"✅ Bild heruntergeladen: {webp_filename}")
-                    else:
-                        print(f"❌ Bild konnte nicht heruntergeladen werden: {src}")
                 
                 # Erstelle sauberes Figure-Element ohne Anführungszeichen bei src
                 figure_html = f'<figure><img'
                 if img_tag.get('data-width'):
-                    figure_html += f' data-width={img_tag["data-width"]}'
+                    figure_html += f' data-width={img_tag.get("data-width")}'
                 if img_tag.get('data-height'):
-                    figure_html += f' data-height={img_tag["data-height"]}'
-                figure_html += f' src={src}></figure>'
+                    figure_html += f' data-height={img_tag.get("data-height")}'
                 
-                content_parts.append(figure_html)
+                if src and 'medium.com' in src:
+                    # Merke Bild für den parallelen Download vor, src wird danach ersetzt
+                    image_filename = get_image_filename(src, post_slug)
+                    image_path = os.path.join(images_dir, image_filename)
+                    downloads.append((len(content_parts), src, image_filename, image_path, figure_html))
                 
-        elif element.name in ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            # Erstelle eine saubere Kopie des Elements ohne CSS-Klassen
-            element_copy = BeautifulSoup(str(element), 'html.parser').find(element.name)
-            
+                content_parts.append(f'{figure_html} src={src}></figure>')
+                
+        elif element.tag in ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+            # Bereinige das Element direkt im Baum (wird danach nicht mehr benötigt)
             # Entferne alle CSS-Klassen und IDs
-            for tag in element_copy.find_all(True):
-                if tag.has_attr('class'):
-                    del tag['class']
-                if tag.has_attr('id'):
-                    del tag['id']
-                if tag.has_attr('name'):
-                    del tag['name']
+            for tag in element.iterdescendants(etree.Element):
+                for attr in ('class', 'id', 'name'):
+                    tag.attrib.pop(attr, None)
             
             # Verarbeite Links
-            process_links_in_element(element_copy, base_url)
+            _process_links_lxml(element, base_url)
             
             # Hole den bereinigten Inhalt und entferne Anführungszeichen bei href
-            inner_html = element_copy.decode_contents()
+            inner_html = _inner_html(element)
             # Entferne Anführungszeichen bei href-Attributen für WordPress-Kompatibilität
-            inner_html = re.sub(r'href="([^"]+)"', r'href=\1', inner_html)
-            inner_html = re.sub(r"href='([^']+)'", r'href=\1', inner_html)
+            inner_html = _HREF_QUOTE_RE.sub(lambda m: 'href=' + (m.group(1) or m.group(2)), inner_html)
             
             if inner_html.strip():
-                content_parts.append(f'<{element.name}>{inner_html}</{element.name}>')
+                content_parts.append(f'<{element.tag}>{inner_html}</{element.tag}>')
                 
-        elif element.name == 'blockquote':
+        elif element.tag == 'blockquote':
             # Für Blockquotes extrahiere nur den Text
-            text_content = element.get_text().strip()
+            text_content = element.text_content().strip()
             if text_content:
                 content_parts.append(f'<blockquote>{text_content}</blockquote>')
                 
-        elif element.name == 'pre':
+        elif element.tag == 'pre':
             # Für Code-Blöcke - extrahiere den eigentlichen Code
-            code_content = element.get_text()
-            if code_content.strip():
-                lines = code_content.strip().split('\n')
-                spans = []
-                for line in lines:
-                    if line.strip():
-                        spans.append(f'<span>{html.escape(line)}</span>')
-                    else:
-                        spans.append('<br>')
+            code_content = element.text_content().strip()
+            if code_content:
+                # Escape den ganzen Block einmal; Zeilenumbrüche bleiben dabei erhalten
+                lines = html.escape(code_content).split('\n')
+                spans = [f'<span>{line}</span>' if line.strip() else '<br>' for line in lines]
                 
                 pre_content = ''.join(spans)
                 content_parts.append(f'<pre>{pre_content}</pre>')
                 
-        elif element.name in ['ul', 'ol']:
+        elif element.tag in ['ul', 'ol']:
             # Verarbeite Listen
             list_items = []
-            for li in element.find_all('li'):
-                li_text = li.get_text().strip()
+            for li in element.iterdescendants('li'):
+                li_text = li.text_content().strip()
                 if li_text:
                     list_items.append(f'<li>{li_text}</li>')
             
             if list_items:
                 list_html = ''.join(list_items)
-                content_parts.append(f'<{element.name}>{list_html}</{element.name}>')
+                content_parts.append(f'<{element.tag}>{list_html}</{element.tag}>')
                 
-        elif element.name == 'hr':
+        elif element.tag == 'hr':
             content_parts.append('<hr>')
     
+    # Lade alle Bilder parallel herunter (netzwerkgebunden, daher Threads)
+    if downloads:
+        # Jeder Zielpfad wird nur einmal geladen, damit keine zwei Threads dieselbe Datei schreiben
+        targets = {image_path: src for _, src, _, image_path, _ in downloads}
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = dict(zip(targets, executor.map(
+                lambda target: download_image(targets[target], target, force_download), targets)))
+        
+        for index, src, image_filename, image_path, figure_html in downloads:
+            if results[image_path]:
+                # Ändere Dateiendung zu .webp
+                base_name = os.path.splitext(image_filename)[0]
+                webp_filename = f"{base_name}.webp"
+                src = f"/wp-content/uploads/{current_year}/{current_month}/{webp_filename}"
+                print(f"✅ Bild heruntergeladen: {webp_filename}")
+                content_parts[index] = f'{figure_html} src={src}></figure>'
+            else:
+                print(f"❌ Bild konnte nicht heruntergeladen werden: {src}")
+    
     # Verbinde alle Teile
     return ''.join(content_parts)
 
-# Hilfsfunktion zum Verarbeiten von Links in einem Element
+# Hilfsfunktion zum Verarbeiten von Links in einem BeautifulSoup-Element
 def process_links_in_element(element, base_url):
     """Verarbeitet alle Links in einem gegebenen HTML-Element."""
     for link_tag in element.find_all('a'):
-        # Entferne alle Medium-spezifischen Attribute
-        for attr in ['data-action', 'data-action-type', 'data-action-value', 'data-anchor-type', 
-                     'data-user-id', 'class', 'id', 'name']:
-            if link_tag.has_attr(attr):
-                del link_tag[attr]
+        # Entferne alle Medium-spezifischen Attribute (inklusive data-href, wird in WordPress nicht benötigt)
+        for attr in _STRIP_ATTRS:
+            link_tag.attrs.pop(attr, None)
         
         # Verarbeite href-Attribute
         href = link_tag.get('href')
         if href and ('medium.com/@mariusschroeder' in href or 'medium.com/medialesson' in href):
             # Extrahiere Post-ID oder Titel aus dem Link für eigene Posts
-            match = re.search(r'/@mariusschroeder/([^?]+)', href)
+            match = _MEDIUM_ME_RE.search(href)
             if match:
                 post_path = match.group(1)
                 link_tag['href'] = f"https://{base_url}/{post_path}"
                 print(f"✅ href ersetzt: {href} → {link_tag['href']}")
             else:
                 # Für medialesson Links
-                match = re.search(r'/medialesson/([^?]+)', href)
+                match = _MEDIUM_ML_RE.search(href)
                 if match:
                     post_path = match.group(1)
                     link_tag['href'] = f"https://{base_url}/{post_path}"
@@ -217,21 +308,47 @@ def process_links_in_element(element, base_url):
             new_href = href.replace('www.marius-schroeder.de', base_url)
             link_tag['href'] = new_href
             print(f"✅ href angepasst: {href} → {new_href}")
+
+# Gleiche Link-Verarbeitung für lxml-Elemente (von process_content_simple verwendet)
+def _process_links_lxml(element, base_url):
+    """Verarbeitet alle Links in einem lxml-Element."""
+    for link_tag in element.iterdescendants('a'):
+        # Entferne alle Medium-spezifischen Attribute (inklusive data-href, wird in WordPress nicht benötigt)
+        for attr in _STRIP_ATTRS:
+            link_tag.attrib.pop(attr, None)
         
-        # Entferne data-href-Attribute komplett (wird in WordPress nicht benötigt)
-        if link_tag.has_attr('data-href'):
-            del link_tag['data-href']
+        # Verarbeite href-Attribute
+        href = link_tag.get('href')
+        if href and ('medium.com/@mariusschroeder' in href or 'medium.com/medialesson' in href):
+            # Extrahiere Post-ID oder Titel aus dem Link für eigene Posts
+            match = _MEDIUM_ME_RE.search(href)
+            if match:
+                post_path = match.group(1)
+                link_tag.set('href', f"https://{base_url}/{post_path}")
+                print(f"✅ href ersetzt: {href} → {link_tag.get('href')}")
+            else:
+                # Für medialesson Links
+                match = _MEDIUM_ML_RE.search(href)
+                if match:
+                    post_path = match.group(1)
+                    link_tag.set('href', f"https://{base_url}/{post_path}")
+                    print(f"✅ href ersetzt: {href} → {link_tag.get('href')}")
+        elif href and 'www.marius-schroeder.de' in href:
+            new_href = href.replace('www.marius-schroeder.de', base_url)
+            link_tag.set('href', new_href)
+            print(f"✅ href angepasst: {href} → {new_href}")
 
 # Legacy-Funktion für Rückwärtskompatibilität
-def process_content(content_html, post_slug, images_dir, base_url):
+def process_content(content_html, post_slug, images_dir, base_url, force_download=False):
     """Legacy-Funktion - verwendet neue einfache Content-Verarbeitung."""
-    return process_content_simple(content_html, post_slug, images_dir, base_url)
+    return process_content_simple(content_html, post_slug, images_dir, base_url, force_download)
 
-# Funktion zum Extrahieren des Datums aus dem Dateinamen
-def extract_date_from_filename(filename):
+# Funktion zum Extrahieren des Datums aus dem Dateinamen (Ergebnis wird gecacht)
+@lru_cache(maxsize=1024)
+def extract_date_from_filename(filename, fallback_timestamp=None):
     """Extrahiert das Publikationsdatum aus dem Medium-Dateinamen."""
     # Format: 2019-07-04_Title-hash.html
-    match = re.search(r'^(\d{4}-\d{2}-\d{2})_', filename)
+    match = _DATE_RE.search(filename)
     if match:
         date_str = match.group(1)
         try:
@@ -239,6 +356,10 @@ def extract_date_from_filename(filename):
         except ValueError:
             pass
     
+    # Fallback auf Änderungszeit der Datei, damit wiederholte Exporte identisch sind
+    if fallback_timestamp is not None:
+        return datetime.fromtimestamp(fallback_timestamp)
+    
     # Fallback auf aktuelles Datum
     return datetime.now()
 
@@ -248,50 +369,31 @@ def extract_categories_and_tags(title, content):
     # Kombiniere Titel und Inhalt für die Analyse
     text = f"{title} {content}".lower()
     
-    # Definiere Kategorie-Mapping basierend auf Schlüsselwörtern
-    category_keywords = {
-        'WEB DEVELOPMENT': ['angular', 'react', 'vue', 'javascript', 'typescript', 'html', 'css', 'web', 'frontend', 'backend', 'blazor', 'asp.net', 'mvc'],
-        '.NET': ['.net', 'c#', 'csharp', 'asp.net', 'entity framework', 'blazor', 'mvc', 'web api', 'dotnet'],
-        'DEVOPS': ['docker', 'kubernetes', 'azure', 'aws', 'deployment', 'ci/cd', 'pipeline', 'devops', 'terraform'],
-        'PROGRAMMING': ['code', 'programming', 'development', 'software', 'algorithm', 'design pattern', 'best practices'],
-        'CLOUD': ['azure', 'aws', 'cloud', 'serverless', 'microservices', 'container'],
-        'MOBILE': ['ionic', 'xamarin', 'mobile', 'android', 'ios', 'app development'],
-        'TUTORIAL': ['tutorial', 'guide', 'how to', 'step by step', 'getting started', 'introduction']
-    }
-    
-    # Definiere Tags basierend auf spezifischen Technologien
-    tag_keywords = [
-        'angular', 'react', 'vue', 'javascript', 'typescript', 'html', 'css', 'sass', 'scss',
-        '.net', 'c#', 'asp.net', 'blazor', 'mvc', 'web api', 'entity framework',
-        'docker', 'kubernetes', 'azure', 'aws', 'git', 'github', 'visual studio',
-        'npm', 'node.js', 'webpack', 'vite', 'ionic', 'xamarin', 'sql', 'database',
-        'api', 'rest', 'graphql', 'json', 'xml', 'microservices', 'architecture',
-        'testing', 'unit testing', 'integration testing', 'debugging', 'performance',
-        'security', 'authentication', 'authorization', 'oauth', 'jwt'
-    ]
-    
-    # Finde passende Kategorie
-    categories = []
-    for category, keywords in category_keywords.items():
-        if any(keyword in text for keyword in keywords):
-            categories.append(category)
+    # Sammle alle vorkommenden Schlüsselwörter in zwei linearen Durchläufen
+    found = set(_WORD_RE.findall(text))
+    found.update(match.group(1) for match in _KEYWORD_PHRASE_RE.finditer(text))
+    
+    # Finde passende Kategorien über den invertierten Index (Reihenfolge wie im Mapping)
+    hits = set()
+    for keyword in found.intersection(_KEYWORD_TO_CATS):
+        hits.update(_KEYWORD_TO_CATS[keyword])
+    categories = [category for category in _CATEGORY_KEYWORDS if category in hits]
     
     # Fallback auf "PROGRAMMING" wenn keine spezifische Kategorie gefunden
     if not categories:
         categories = ['PROGRAMMING']
     
     # Finde passende Tags
-    tags = []
-    for tag in tag_keywords:
-        if tag in text:
-            tags.append(tag.upper())
+    tags = [tag.upper() for tag in _TAG_KEYWORDS if tag in found]
     
     # Füge zusätzliche Tags basierend auf Titel hinzu
-    title_words = re.findall(r'\b\w+\b', title.lower())
+    tags_lower = {tag.lower() for tag in tags}
+    title_words = _WORD_RE.findall(title.lower())
     for word in title_words:
-        if len(word) > 3 and word not in [tag.lower() for tag in tags]:
+        if len(word) > 3 and word not in tags_lower:
             if word in ['dependencies', 'versioning', 'tutorial', 'guide', 'introduction']:
                 tags.append(word.upper())
+                tags_lower.add(word)
     
     # Limitiere auf maximal 5 Tags
     tags = tags[:5]
@@ -312,16 +414,18 @@ def build_wp_item(title, content, date, base_url="example.com", author="Marius",
     categories, tags = extract_categories_and_tags(title, content)
     
     # Erstelle Kategorie-XML
-    category_xml = ""
-    for i, category in enumerate(categories):
+    cat_parts = []
+    for category in categories:
         category_slug = create_slug(category)
-        category_xml += f'\n\t\t<category domain="category" nicename="{category_slug}"><![CDATA[{category}]]></category>'
+        cat_parts.append(f'\n\t\t<category domain="category" nicename="{category_slug}"><![CDATA[{category}]]></category>')
+    category_xml = ''.join(cat_parts)
     
     # Erstelle Tag-XML
-    tag_xml = ""
+    tag_parts = []
     for tag in tags:
         tag_slug = tag.replace(' ', '-').replace('.', '').replace('#', '').lower()  # Für nicename
-        tag_xml += f'\n\t\t<category domain="post_tag" nicename="{tag_slug}"><![CDATA[{tag}]]></category>'
+        tag_parts.append(f'\n\t\t<category domain="post_tag" nicename="{tag_slug}"><![CDATA[{tag}]]></category>')
+    tag_xml = ''.join(tag_parts)
     
     return f"""
 	<item>
@@ -350,7 +454,7 @@ def build_wp_item(title, content, date, base_url="example.com", author="Marius",
 	</item>"""
 
 # XML Kopf mit korrekter WordPress-Formatierung
-def build_wp_xml(items):
+def build_wp_xml_header():
     return f"""<?xml version="1.0" encoding="UTF-8" ?>
 <!-- This is a WordPress eXtended RSS file generated by WordPress as an export of your site. -->
 <!-- It contains information about your site's posts, pages, comments, categories, and other content. -->
@@ -440,10 +544,18 @@ def build_wp_xml(items):
 	</wp:category>
 
 	<generator>Medium to WordPress Migration Script</generator>
-{"".join(items)}
+"""
+
+# XML Fuß, schließt Channel und RSS
+def build_wp_xml_footer():
+    return """
 </channel>
 </rss>"""
 
+# Komplettes XML in einem String (für kleine Exporte wie einzelne Posts)
+def build_wp_xml(items):
+    return build_wp_xml_header() + "".join(items) + build_wp_xml_footer()
+
 # Medium HTML-Dateien parsen
 def parse_medium_html(file_path):
     with open(file_path, encoding="utf-8") as f:
@@ -456,31 +568,39 @@ def parse_medium_html(file_path):
         content_html = str(body_section)
         return title, content_html
 
+# Hilfsfunktion zum einmaligen Einlesen der HTML-Dateien eines Ordners
+def _list_html_files(folder_path):
+    """Gibt die HTML-Dateien eines Ordners als DirEntry-Liste sortiert nach Namen zurück."""
+    with os.scandir(folder_path) as it:
+        return sorted((entry for entry in it if entry.name.endswith('.html') and entry.is_file()),
+                      key=lambda entry: entry.name)
+
 # Hilfsfunktion zum Auflisten verfügbarer Blog Posts
-def list_available_posts(folder_path):
+def list_available_posts(folder_path, html_entries=None):
     """Listet alle verfügbaren HTML-Dateien mit ihren Titeln auf."""
     print("📋 Verfügbare Blog Posts:")
     print("=" * 60)
     
-    html_files = [f for f in os.listdir(folder_path) if f.endswith('.html')]
+    if html_entries is None:
+        html_entries = _list_html_files(folder_path)
+    html_files = [entry.name for entry in html_entries]
     
-    for i, file_name in enumerate(html_files, 1):
-        file_path = os.path.join(folder_path, file_name)
-        result = parse_medium_html(file_path)
+    for i, entry in enumerate(html_entries, 1):
+        result = parse_medium_html(entry.path)
         if result:
             title, _ = result
             print(f"{i:2d}. {title}")
-            print(f"    📁 {file_name}")
+            print(f"    📁 {entry.name}")
         else:
             print(f"{i:2d}. ❌ Konnte nicht geparst werden")
-            print(f"    📁 {file_name}")
+            print(f"    📁 {entry.name}")
         print()
     
     print(f"Gesamt: {len(html_files)} HTML-Dateien gefunden")
     return html_files
 
 # Funktion zum Exportieren eines einzelnen Blog Posts
-def convert_single_medium_post_to_wordpress_xml(file_path, output_file="single_post_export.xml", base_url="example.com", download_images=True):
+def convert_single_medium_post_to_wordpress_xml(file_path, output_file="single_post_export.xml", base_url="example.com", download_images=True, force_download=False):
     """Exportiert einen einzelnen Medium Blog Post zu WordPress XML."""
     
     if not os.path.exists(file_path):
@@ -493,9 +613,8 @@ def convert_single_medium_post_to_wordpress_xml(file_path, output_file="single_p
     
     # Erstelle Bilder-Ordner
     images_dir = "wordpress_images"
-    if download_images and not os.path.exists(images_dir):
-        os.makedirs(images_dir)
-        print(f"📁 Bilder-Ordner erstellt: {images_dir}")
+    if download_images:
+        os.makedirs(images_dir, exist_ok=True)
     
     print(f"🔄 Verarbeite: {os.path.basename(file_path)}")
     result = parse_medium_html(file_path)
@@ -509,18 +628,25 @@ def convert_single_medium_post_to_wordpress_xml(file_path, output_file="single_p
     
     # Verarbeite Bilder und Links nur wenn gewünscht
     if download_images:
-        content = process_content(content, post_slug, images_dir, base_url)
+        content = process_content(content, post_slug, images_dir, base_url, force_download)
     
     # Extrahiere Datum aus Dateiname
     filename = os.path.basename(file_path)
-    date = extract_date_from_filename(filename)
+    date = extract_date_from_filename(filename, os.path.getmtime(file_path))
     post_id = hash(title) % 100000  # Größerer Bereich für Post-IDs
     
     wp_item = build_wp_item(title, content, date, base_url, post_id=post_id)
     
     full_xml = build_wp_xml([wp_item])
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(full_xml)
+    # Über eine temporäre Datei schreiben, damit ein Fehler keine halbe Export-Datei hinterlässt
+    temp_file = f"{output_file}.tmp"
+    try:
+        with open(temp_file, "w", encoding="utf-8") as f:
+            f.write(full_xml)
+        os.replace(temp_file, output_file)
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
     
     print(f"✅ Post verarbeitet: {title}")
     print(f"\n🎉 Einzelner Post exportiert!")
@@ -531,45 +657,58 @@ def convert_single_medium_post_to_wordpress_xml(file_path, output_file="single_p
     
     return True
 
-# Hauptfunktion
-def convert_medium_folder_to_wordpress_xml(folder_path, output_file="wordpress_export.xml", base_url="example.com", download_images=True):
-    items = []
-    
-    # Erstelle Bilder-Ordner
-    images_dir = "wordpress_images"
-    if download_images and not os.path.exists(images_dir):
-        os.makedirs(images_dir)
-        print(f"📁 Bilder-Ordner erstellt: {images_dir}")
-    
-    for file_name in os.listdir(folder_path):
-        if not file_name.endswith(".html"):
-            continue
-        
+# Generator, der die WordPress-Items der HTML-Dateien nacheinander erzeugt
+def iter_wp_items(html_entries, images_dir, base_url, download_images=True, force_download=False):
+    """Erzeugt die WordPress-Items für die übergebenen HTML-Dateien einzeln."""
+    for entry in html_entries:
+        file_name = entry.name
         print(f"🔄 Verarbeite: {file_name}")
-        result = parse_medium_html(os.path.join(folder_path, file_name))
+        result = parse_medium_html(entry.path)
         if result:
             title, content = result
             post_slug = create_slug(title)
             
             # Verarbeite Bilder und Links nur wenn gewünscht
             if download_images:
-                content = process_content(content, post_slug, images_dir, base_url)
+                content = process_content(content, post_slug, images_dir, base_url, force_download)
             
             # Extrahiere Datum aus Dateiname
-            date = extract_date_from_filename(file_name)
+            date = extract_date_from_filename(file_name, entry.stat().st_mtime)
             post_id = hash(title) % 100000  # Größerer Bereich für Post-IDs
             
-            wp_item = build_wp_item(title, content, date, base_url, post_id=post_id)
-            items.append(wp_item)
+            yield build_wp_item(title, content, date, base_url, post_id=post_id)
             print(f"✅ Post verarbeitet: {title}")
 
-    full_xml = build_wp_xml(items)
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(full_xml)
+# Hauptfunktion
+def convert_medium_folder_to_wordpress_xml(folder_path, output_file="wordpress_export.xml", base_url="example.com", download_images=True, force_download=False, html_entries=None):
+    # Erstelle Bilder-Ordner
+    images_dir = "wordpress_images"
+    if download_images:
+        os.makedirs(images_dir, exist_ok=True)
+    
+    if html_entries is None:
+        html_entries = _list_html_files(folder_path)
+    
+    # Schreibe das XML Post für Post direkt in die Datei statt es komplett im Speicher aufzubauen.
+    # Geschrieben wird in eine temporäre Datei, die erst am Ende den vorherigen Export ersetzt,
+    # damit ein Fehler mitten im Export keine abgeschnittene Datei hinterlässt
+    temp_file = f"{output_file}.tmp"
+    exported = 0
+    try:
+        with open(temp_file, "w", encoding="utf-8") as f:
+            f.write(build_wp_xml_header())
+            for wp_item in iter_wp_items(html_entries, images_dir, base_url, download_images, force_download):
+                f.write(wp_item)
+                exported += 1
+            f.write(build_wp_xml_footer())
+        os.replace(temp_file, output_file)
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
     
     print(f"\n🎉 Export abgeschlossen!")
     print(f"📄 WordPress XML: {output_file}")
-    print(f"📊 {len(items)} Blog Posts exportiert")
+    print(f"📊 {exported} Blog Posts exportiert")
     if download_images:
         print(f"🖼️  Bilder-Ordner: {images_dir}")
         print(f"💡 Tipp: Lade alle Bilder aus '{images_dir}' in deine WordPress Media Library hoch")
@@ -579,6 +718,11 @@ def convert_medium_folder_to_wordpress_xml(folder_path, output_file="wordpress_e
 if __name__ == "__main__":
     import sys
     
+    # --force lädt auch bereits vorhandene Bilder erneut herunter
+    force_download = "--force" in sys.argv
+    if force_download:
+        sys.argv.remove("--force")
+    
     if len(sys.argv) < 2:
         print("📋 Verfügbare Blog Posts:")
         print("=" * 60)
@@ -587,6 +731,7 @@ if __name__ == "__main__":
         print("  python medium_to_wordpress.py all <base_url>")
         print("  python medium_to_wordpress.py single <datei_oder_nummer> <base_url>")
         print("  python medium_to_wordpress.py list")
+        print("  Option --force: bereits vorhandene Bilder erneut herunterladen")
         sys.exit(0)
     
     command = sys.argv[1].lower()
@@ -602,7 +747,7 @@ if __name__ == "__main__":
         
         base_url = sys.argv[2]
         print(f"🚀 Exportiere alle Posts nach {base_url}...")
-        convert_medium_folder_to_wordpress_xml("export_htmls", "wordpress_export.xml", base_url, download_images=True)
+        convert_medium_folder_to_wordpress_xml("export_htmls", "wordpress_export.xml", base_url, download_images=True, force_download=force_download)
     
     elif command == "single":
         if len(sys.argv) < 4:
@@ -617,28 +762,24 @@ if __name__ == "__main__":
         
         # Prüfe ob es eine Nummer ist
         if file_or_number.isdigit():
-            # Hole Liste der HTML-Dateien
-            html_files = []
-            export_dir = "export_htmls"
-            
-            for filename in sorted(os.listdir(export_dir)):
-                if filename.endswith(".html"):
-                    html_files.append(filename)
+            # Hole Liste der HTML-Dateien (gleiche Reihenfolge wie bei "list")
+            html_entries = _list_html_files("export_htmls")
             
             post_number = int(file_or_number)
-            if 1 <= post_number <= len(html_files):
-                selected_file = html_files[post_number - 1]
-                file_path = os.path.join(export_dir, selected_file)
+            if 1 <= post_number <= len(html_entries):
+                selected_entry = html_entries[post_number - 1]
+                selected_file = selected_entry.name
+                file_path = selected_entry.path
                 
                 # Erstelle Output-Dateiname basierend auf dem Original
                 base_name = os.path.splitext(selected_file)[0]
                 output_file = f"{base_name}.xml"
                 
                 print(f"🚀 Exportiere Post #{post_number}: {selected_file}")
-                convert_single_medium_post_to_wordpress_xml(file_path, output_file, base_url, download_images=True)
+                convert_single_medium_post_to_wordpress_xml(file_path, output_file, base_url, download_images=True, force_download=force_download)
             else:
                 print(f"❌ Ungültige Post-Nummer: {post_number}")
-                print(f"   Verfügbare Posts: 1-{len(html_files)}")
+                print(f"   Verfügbare Posts: 1-{len(html_entries)}")
                 sys.exit(1)
         else:
             # Behandle als Dateiname
@@ -656,7 +797,7 @@ if __name__ == "__main__":
             output_file = f"{base_name}.xml"
             
             print(f"🚀 Exportiere Post: {os.path.basename(file_path)}")
-            convert_single_medium_post_to_wordpress_xml(file_path, output_file, base_url, download_images=True)
+            convert_single_medium_post_to_wordpress_xml(file_path, output_file, base_url, download_images=True, force_download=force_download)
     
     else:
         print(f"❌ Unbekannter Befehl: {command}")
@@ -17,6 +17,7 @@ Requirements:
 - beautifulsoup4
 - requests
 - lxml (optional, for better HTML parsing)
+- Pillow (optional, for downscaling images)
 
 Usage:
     python medium_to_wordpress.py list
@@ -31,35 +32,429 @@ import os
 import re
 import sys
 import html
+import hashlib
+import json
+import shutil
+import time
+import zlib
 import requests
 import argparse
 import logging
-from bs4 import BeautifulSoup
+import multiprocessing
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from urllib.parse import urlparse
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict
+from typing import Optional, Tuple, List, Dict, FrozenSet, Iterator, TextIO, Union
 
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Prefer the C-based lxml parser, fall back to the built-in one
+try:
+    from lxml import etree as _etree
+    _PARSER = 'lxml'
+    # Every link of a fragment in one compiled query
+    _ANCHOR_XPATH = _etree.XPath('.//a')
+except ImportError:
+    _PARSER = 'html.parser'
+
+# Pillow is optional and only needed to downscale downloaded images
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Image download settings
+_IMAGE_DOWNLOAD_TIMEOUT = 30
+_IMAGE_CHUNK_SIZE = 1 << 20
+# Images are downloaded concurrently by this many threads, shared by all posts
+# and split between the worker processes of a parallel conversion
+_IMAGE_DOWNLOAD_WORKERS = 16
+# Animated or vector formats are kept as downloaded
+_NON_RESIZABLE_FORMATS = frozenset(['GIF', 'SVG'])
+
+# Downloaded image filenames by URL digest, kept inside the images directory between runs
+_URL_CACHE_FILE = '.url_cache.json'
+# Seconds after which a lock on the cache file is considered left behind by a crashed process
+_URL_CACHE_LOCK_TIMEOUT = 10
+
+# Folder exports number their posts consecutively starting from this ID
+_FIRST_POST_ID = 1000
+# Write buffer of the export file, so many small items share one write call
+_OUTPUT_BUFFER_SIZE = 1 << 20
+# Documents kept by the parse cache; the oldest entry is dropped beyond this
+_PARSE_CACHE_SIZE = 256
+# Posts handed to a worker process per batch
+_CONVERT_CHUNKSIZE = 4
+
+# Shared HTTP session so image downloads reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+_SESSION.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                                       max_retries=Retry(total=3, backoff_factor=0.3)))
+
+# Title slugs, image filenames and export filename dates
+_TAG_RE = re.compile(r'<[^>]+>')
+_NONWORD_RE = re.compile(r'[^\w\s-]')
+_DASH_RE = re.compile(r'[-\s]+')
+_DASH_RUN_RE = re.compile(r'-{2,}')
+
+# ASCII slug table: keeps word characters (lowercased) and dashes, turns whitespace
+# into dashes and drops everything else in a single translate pass
+_SLUG_TABLE = {
+    code: (chr(code).lower() if chr(code).isalnum() or chr(code) in '_-'
+           else '-' if chr(code).isspace() else None)
+    for code in range(128)
+}
+_FNAME_STRIP = str.maketrans('', '', '*<>:"/\\|?')
+_DATE_RE = re.compile(r'^(\d{4}-\d{2}-\d{2})_')
+# Same date prefix, matched against one filename per line
+_DATE_LINE_RE = re.compile(r'^(\d{4}-\d{2}-\d{2})_.*$', re.M)
+
+# Medium post slugs end with a hash ID, e.g. post-title-5691beba463e
+_MEDIUM_HASH_RE = re.compile(r'-[a-zA-Z0-9]{6,}$')
+_SLUG_INVALID_RE = re.compile(r'[^a-zA-Z0-9\-]')
+_MULTI_DASH_RE = re.compile(r'-+')
+
+# Batched variants of the slug patterns, working on slugs joined by _SLUG_SEPARATOR
+_SLUG_SEPARATOR = '\x01'
+_BATCH_QUERY_RE = re.compile(r'\?[^\x01]*')
+_BATCH_HASH_RE = re.compile(r'-[a-zA-Z0-9]{6,}(?=\x01|$)')
+_BATCH_SLUG_INVALID_RE = re.compile(r'[^a-zA-Z0-9\-\x01]')
+_BATCH_EDGE_DASH_RE = re.compile(r'-*\x01-*')
+
+# Medium URL patterns: profile (medium.com/@user/post), publication
+# (medium.com/publication/post) and direct (medium.com/post) links, with or
+# without a scheme
+_MEDIUM_LINK_PATTERN = (
+    r'(?P<medium>(?:(?:https?:)?//)?(?:[^/]*\.)?medium\.com/)'
+    r'(?:@[^/]+/(?P<profile>[^?/#]+)'
+    r'|[^/@][^/]*/(?P<publication>[^?/#]+)'
+    r'|(?P<direct>[^/@?#][^/?#]*))?'
+)
+
+# Category mapping based on keywords
+_CATEGORY_KEYWORDS: Dict[str, FrozenSet[str]] = {
+    'WEB DEVELOPMENT': frozenset(['angular', 'react', 'vue', 'javascript', 'typescript', 'html', 'css', 'web', 'frontend', 'backend']),
+    '.NET': frozenset(['.net', 'c#', 'csharp', 'asp.net', 'entity framework', 'blazor', 'mvc', 'web api', 'dotnet']),
+    'DEVOPS': frozenset(['docker', 'kubernetes', 'azure', 'aws', 'deployment', 'ci/cd', 'pipeline', 'devops', 'terraform']),
+    'PROGRAMMING': frozenset(['code', 'programming', 'development', 'software', 'algorithm', 'design pattern']),
+    'CLOUD': frozenset(['azure', 'aws', 'cloud', 'serverless', 'microservices', 'container']),
+    'MOBILE': frozenset(['ionic', 'xamarin', 'mobile', 'android', 'ios', 'app development']),
+    'TUTORIAL': frozenset(['tutorial', 'guide', 'how to', 'step by step', 'getting started', 'introduction']),
+}
+
+# Tag keywords
+_TAG_KEYWORDS = (
+    'angular', 'react', 'vue', 'javascript', 'typescript', 'html', 'css', 'sass',
+    '.net', 'c#', 'asp.net', 'blazor', 'mvc', 'web api', 'entity framework',
+    'docker', 'kubernetes', 'azure', 'aws', 'git', 'github', 'visual studio',
+    'npm', 'node.js', 'webpack', 'vite', 'ionic', 'xamarin', 'sql', 'database',
+    'api', 'rest', 'graphql', 'json', 'microservices', 'architecture',
+    'testing', 'unit testing', 'debugging', 'performance', 'security'
+)
+
+# Single-word keywords are matched against the set of words in a post, everything
+# else (multi-word or punctuated keywords) with one scan over the text
+_WORD_RE = re.compile(r'\w+')
+_ALL_KEYWORDS = frozenset(_TAG_KEYWORDS).union(*_CATEGORY_KEYWORDS.values())
+
+# Inverted index: keyword -> categories it belongs to
+_KEYWORD_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    keyword: tuple(category for category, keywords in _CATEGORY_KEYWORDS.items() if keyword in keywords)
+    for keyword in frozenset().union(*_CATEGORY_KEYWORDS.values())
+}
+_KEYWORD_PHRASES = sorted((keyword for keyword in _ALL_KEYWORDS if not _WORD_RE.fullmatch(keyword)),
+                          key=len, reverse=True)
+
+
+def _bounded_phrase(phrase: str) -> str:
+    """Regex for a phrase that must not start or end inside a word (e.g. "how to" in "somehow")."""
+    return ((r'(?<!\w)' if _WORD_RE.match(phrase[0]) else '') + re.escape(phrase)
+            + (r'(?!\w)' if _WORD_RE.match(phrase[-1]) else ''))
+
+
+# The leading character class rejects most positions before any phrase is tried
+_KEYWORD_PHRASE_RE = re.compile(
+    '(?=[' + re.escape(''.join(sorted({p[0] for p in _KEYWORD_PHRASES}))) + '])'
+    '(?=(' + '|'.join(_bounded_phrase(p) for p in _KEYWORD_PHRASES) + '))'
+)
+
+# Tag nicenames: spaces become dashes, dots and hashes are dropped
+_TAG_SLUG_TRANS = str.maketrans({' ': '-', '.': None, '#': None})
+
+# Medium-specific attributes stripped from links
+_LINK_ATTRS_TO_REMOVE = ('data-action', 'data-action-type', 'data-action-value',
+                         'data-anchor-type', 'data-user-id', 'class', 'id', 'name')
+
+# Attributes removed from every tag inside paragraphs and headings
+_STYLE_ATTRS_TO_REMOVE = ('class', 'id', 'name')
+
+# Medium system pages that must not be rewritten as posts
+_MEDIUM_SYSTEM_PATHS = ('about', 'help', 'settings', 'membership', 'partner', 'creators')
+
+# Restricts parsing to anchor tags when only link rewriting is needed
+_LINK_STRAINER = SoupStrainer('a')
+# Restricts parsing of export files to the title and the content sections,
+# skipping the head with Medium's large inline stylesheet
+_DOCUMENT_STRAINER = SoupStrainer(['h1', 'section'])
+# Cached body HTML only needs its section re-parsed
+_BODY_STRAINER = SoupStrainer('section')
+
+
+@lru_cache(maxsize=None)
+def _compile_url_replacements(patterns: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """
+    Compile URL replacement patterns into a single longest-first alternation.
+    
+    Args:
+        patterns: Literal patterns to replace
+        
+    Returns:
+        Compiled regex, or None if there are no patterns
+    """
+    if not patterns:
+        return None
+    ordered = sorted(patterns, key=len, reverse=True)
+    return re.compile('|'.join(re.escape(pattern) for pattern in ordered))
+
+
+@lru_cache(maxsize=None)
+def _compile_link_classifier(base_url: str) -> Tuple[str, re.Pattern]:
+    """
+    Compile a single regex that classifies links for a target domain.
+    
+    The name of the last matched group tells which rewrite applies: 'profile',
+    'publication' or 'direct' for Medium posts, 'medium' for other Medium
+    pages and 'own' for absolute links to the target domain.
+    
+    Args:
+        base_url: Domain without protocol
+        
+    Returns:
+        Tuple of (lowercase host, compiled classifier for lowercased links)
+    """
+    host = base_url.lower()
+    own_pattern = rf'(?P<own>https?://(?:www\.)?{re.escape(host)}(?=[/?#]|$))'
+    return host, re.compile(f'{_MEDIUM_LINK_PATTERN}|{own_pattern}')
+
+
+@lru_cache(maxsize=4096)
+def _create_slug(title: str) -> str:
+    """
+    Create a URL-friendly slug from title.
+    
+    Args:
+        title: Post title
+        
+    Returns:
+        URL-friendly slug
+    """
+    # Remove HTML tags if present
+    clean_title = _TAG_RE.sub('', title)
+    if clean_title.isascii():
+        return _DASH_RUN_RE.sub('-', clean_title.translate(_SLUG_TABLE)).strip('-')
+    # Replace special characters and spaces
+    slug = _NONWORD_RE.sub('', clean_title)
+    slug = _DASH_RE.sub('-', slug)
+    return slug.strip('-').lower()
+
+
+@lru_cache(maxsize=4096)
+def _clean_medium_post_slug(post_path: str) -> str:
+    """
+    Clean Medium post slug by removing hash-like IDs and normalizing.
+    
+    Args:
+        post_path: Raw post path from Medium URL
+        
+    Returns:
+        Cleaned slug suitable for WordPress
+    """
+    # Remove query parameters first
+    post_path = post_path.split('?')[0]
+    
+    # Medium post URLs typically end with a hash like: post-title-5691beba463e
+    # We want to remove this hash part (usually 6+ alphanumeric characters)
+    # Pattern: Remove trailing dash followed by 6+ alphanumeric characters
+    post_path = _MEDIUM_HASH_RE.sub('', post_path)
+    
+    # Additional cleanup: remove any remaining weird characters
+    post_path = _SLUG_INVALID_RE.sub('', post_path)
+    
+    # Remove multiple consecutive dashes and trim
+    post_path = _MULTI_DASH_RE.sub('-', post_path).strip('-')
+    
+    return post_path.lower()
+
+
+def _downscale_image(image_path: str, max_width: int):
+    """
+    Shrink an image file to at most max_width pixels wide.
+    
+    Files Pillow cannot read, animated images and images that are narrow
+    enough are left untouched. The smaller image is written to a temporary
+    file that replaces the original once it is complete.
+    
+    Args:
+        image_path: Path to the downloaded image
+        max_width: Maximum width in pixels
+    """
+    resized_path = f"{image_path}.resized"
+    try:
+        with Image.open(image_path) as image:
+            if (image.width <= max_width or image.format in _NON_RESIZABLE_FORMATS
+                    or getattr(image, 'is_animated', False)):
+                return
+            image_format = image.format
+            image.thumbnail((max_width, image.height), Image.LANCZOS)
+            if image_format == 'JPEG':
+                image.save(resized_path, image_format, optimize=True, quality=85)
+            else:
+                image.save(resized_path, image_format, optimize=True)
+        os.replace(resized_path, image_path)
+    except Exception as e:
+        logger.warning(f"Could not downscale {image_path}: {e}")
+        if os.path.exists(resized_path):
+            os.remove(resized_path)
+
+
+def _dates_from_filenames(filenames: List[str]) -> List[Optional[datetime]]:
+    """
+    Extract the publication dates of many Medium export filenames with one regex scan.
+    
+    Args:
+        filenames: Export filenames, e.g. 2019-07-04_Title-hash.html
+        
+    Returns:
+        Dates in the order of filenames, None where a name has no valid date
+    """
+    dates = {}
+    for match in _DATE_LINE_RE.finditer('\n'.join(filenames)):
+        try:
+            dates[match.group(0)] = datetime.strptime(match.group(1), '%Y-%m-%d')
+        except ValueError:
+            pass
+    return [dates.get(filename) for filename in filenames]
+
+
+def _url_key(url: str) -> str:
+    """Digest identifying an image URL in the image cache."""
+    return hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _read_url_cache(cache_path: str) -> Dict[str, str]:
+    """
+    Read an image cache file.
+    
+    Args:
+        cache_path: Path to the cache file
+        
+    Returns:
+        Image filenames by URL digest, empty if the file is missing or unreadable
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cached if isinstance(cached, dict) else {}
+
+
+def _cdata_escape(text: str) -> str:
+    """
+    Make text safe for a CDATA section by splitting any ']]>' across two sections.
+    
+    Args:
+        text: Text placed between <![CDATA[ and ]]>
+        
+    Returns:
+        Escaped text
+    """
+    return text.replace(']]>', ']]]]><![CDATA[>')
+
+
+def _figure_html(img_attrs: List[str], src: Optional[str]) -> str:
+    """
+    Build a clean figure element around an image.
+    
+    Args:
+        img_attrs: Rendered attributes of the image, without src
+        src: Image source
+        
+    Returns:
+        Figure HTML
+    """
+    attrs = ' '.join(img_attrs + [f'src="{src}"'])
+    return f'<figure><img {attrs}></figure>'
+
+
+def _scan_html_files(folder_path: str) -> List[os.DirEntry]:
+    """
+    Scan a folder once for HTML files.
+    
+    Args:
+        folder_path: Folder to scan
+        
+    Returns:
+        Directory entries of the HTML files, sorted by name
+        
+    Raises:
+        FileNotFoundError, NotADirectoryError: If folder_path is not a folder
+    """
+    with os.scandir(folder_path) as it:
+        return sorted((entry for entry in it if entry.name.endswith('.html') and entry.is_file()),
+                      key=lambda entry: entry.name)
+
 
 class MediumToWordPressConverter:
     """Main converter class for Medium to WordPress migration."""
     
-    def __init__(self, base_url: str = "example.com", download_images: bool = True):
+    def __init__(self, base_url: str = "example.com", download_images: bool = True,
+                 url_replacements: Optional[List[Tuple[str, str]]] = None,
+                 session: Optional[requests.Session] = None, max_image_width: Optional[int] = None):
         """
         Initialize the converter.
         
         Args:
             base_url: Target WordPress site domain
             download_images: Whether to download images locally
+            url_replacements: Optional (pattern, replacement) pairs applied to every link
+            session: HTTP session for image downloads (defaults to the shared pooled session)
+            max_image_width: Downscale downloaded images wider than this (ignored without Pillow)
         """
         self.base_url = base_url
         self.download_images = download_images
         self.images_dir = "wordpress_images"
+        self.session = session or _SESSION
+        self.max_image_width = max_image_width
+        
+        # Title and body HTML of parsed documents by path, with the (mtime, size) they were parsed at
+        self._parse_cache: Dict[str, Tuple[Tuple[int, int], Tuple[str, str]]] = {}
+        # Filenames of the images downloaded so far by URL digest, shared by all
+        # posts and loaded from the images directory with the first download
+        self._downloaded_urls: Optional[Dict[str, str]] = None
+        # Download threads, started with the first image and reused for every post
+        self._download_executor: Optional[ThreadPoolExecutor] = None
+        self._download_threads = _IMAGE_DOWNLOAD_WORKERS
+        
+        # Precomputed host forms for matching links to our own domain
+        self._host, self._link_classifier = _compile_link_classifier(base_url)
+        self._href_prefix = f"https://{base_url.rstrip('/')}/"
+        
+        # Compiled replacements are shared between converters with the same configuration
+        self.url_replacements = dict(url_replacements or [])
+        self._url_replacement_re = _compile_url_replacements(tuple(self.url_replacements))
         
         # Create images directory if needed
         if self.download_images and not os.path.exists(self.images_dir):
@@ -77,19 +472,27 @@ class MediumToWordPressConverter:
         Returns:
             True if successful, False otherwise
         """
+        # Filenames are deterministic, so an image from a previous run can be reused
+        if os.path.exists(save_path) and os.path.getsize(save_path) > 0:
+            return True
+        # Download into a temporary file, so an interrupted download is never reused
+        part_path = f"{save_path}.part"
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(url, stream=True, headers=headers, timeout=30)
+            response = self.session.get(url, stream=True, timeout=_IMAGE_DOWNLOAD_TIMEOUT)
             response.raise_for_status()
             
-            with open(save_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            # Copy the raw stream in large blocks, decoding gzip/deflate on the fly
+            response.raw.decode_content = True
+            with open(part_path, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=_IMAGE_CHUNK_SIZE)
+            if self.max_image_width and Image is not None:
+                _downscale_image(part_path, self.max_image_width)
+            os.replace(part_path, save_path)
             return True
         except Exception as e:
             logger.warning(f"❌ Failed to download {url}: {e}")
+            if os.path.exists(part_path):
+                os.remove(part_path)
             return False
     
     def get_image_filename(self, image_url: str, post_slug: str) -> str:
@@ -108,11 +511,11 @@ class MediumToWordPressConverter:
         
         # Generate filename if none found
         if not original_filename or '.' not in original_filename:
-            url_hash = abs(hash(image_url)) % 10000
+            url_hash = hashlib.blake2b(image_url.encode('utf-8'), digest_size=6).hexdigest()
             original_filename = f"image_{url_hash}.jpg"
         
         # Clean filename of problematic characters
-        original_filename = re.sub(r'[*<>:"/\\|?]', '', original_filename)
+        original_filename = original_filename.translate(_FNAME_STRIP)
         
         # Add post slug prefix for uniqueness
         name, ext = os.path.splitext(original_filename)
@@ -122,130 +525,295 @@ class MediumToWordPressConverter:
         """
         Create a URL-friendly slug from title.
         
+        Results are cached, as category names are slugified for every post.
+        
         Args:
             title: Post title
             
         Returns:
             URL-friendly slug
         """
-        # Remove HTML tags if present
-        clean_title = re.sub(r'<[^>]+>', '', title)
-        # Replace special characters and spaces
-        slug = re.sub(r'[^\w\s-]', '', clean_title)
-        slug = re.sub(r'[-\s]+', '-', slug)
-        return slug.strip('-').lower()
+        return _create_slug(title)
     
     def clean_medium_post_slug(self, post_path: str) -> str:
         """
         Clean Medium post slug by removing hash-like IDs and normalizing.
         
+        Results are cached, so posts linked many times are only cleaned once.
+        
         Args:
             post_path: Raw post path from Medium URL
             
         Returns:
             Cleaned slug suitable for WordPress
         """
-        # Remove query parameters first
-        post_path = post_path.split('?')[0]
+        return _clean_medium_post_slug(post_path)
+
+    def apply_url_replacements(self, url: str) -> str:
+        """
+        Apply the configured URL replacements to a URL in a single pass.
         
-        # Medium post URLs typically end with a hash like: post-title-5691beba463e
-        # We want to remove this hash part (usually 6+ alphanumeric characters)
-        # Pattern: Remove trailing dash followed by 6+ alphanumeric characters
-        post_path = re.sub(r'-[a-zA-Z0-9]{6,}$', '', post_path)
+        Args:
+            url: URL to rewrite
+            
+        Returns:
+            URL with all configured patterns replaced
+        """
+        if self._url_replacement_re is None:
+            return url
+        return self._url_replacement_re.sub(lambda m: self.url_replacements[m.group(0)], url)
+    
+    def parse_links(self, content_html: str) -> BeautifulSoup:
+        """
+        Parse only the links of an HTML document.
         
-        # Additional cleanup: remove any remaining weird characters
-        post_path = re.sub(r'[^a-zA-Z0-9\-]', '', post_path)
+        Builds a tree containing nothing but the <a> tags, which is much
+        cheaper for large articles when only link rewriting is needed.
         
-        # Remove multiple consecutive dashes and trim
-        post_path = re.sub(r'-+', '-', post_path).strip('-')
+        Args:
+            content_html: Raw HTML content
+            
+        Returns:
+            BeautifulSoup tree that can be passed to process_links_in_element
+        """
+        return BeautifulSoup(content_html, _PARSER, parse_only=_LINK_STRAINER)
+    
+    def clean_medium_post_slugs(self, post_paths: List[str]) -> List[str]:
+        """
+        Clean many Medium post slugs at once.
         
-        return post_path.lower()
-
-    def process_links_in_element(self, element, base_url: str):
+        Equivalent to calling clean_medium_post_slug for every entry, but runs
+        each substitution once over all slugs joined together.
+        
+        Args:
+            post_paths: Raw post paths from Medium URLs
+            
+        Returns:
+            Cleaned slugs in the same order
+        """
+        if not post_paths:
+            return []
+        
+        joined = _SLUG_SEPARATOR.join(post_paths)
+        joined = _BATCH_QUERY_RE.sub('', joined)
+        joined = _BATCH_HASH_RE.sub('', joined)
+        joined = _BATCH_SLUG_INVALID_RE.sub('', joined)
+        joined = _MULTI_DASH_RE.sub('-', joined)
+        joined = _BATCH_EDGE_DASH_RE.sub(_SLUG_SEPARATOR, joined).strip('-')
+        return joined.lower().split(_SLUG_SEPARATOR)
+    
+    def rewrite_link(self, href: str, base_url: str) -> str:
+        """
+        Compute the WordPress URL for a single link.
+        
+        Args:
+            href: Original link target
+            base_url: Target base URL for internal links (without protocol)
+            
+        Returns:
+            Rewritten URL, or the original href if it needs no change
+        """
+        if self._url_replacement_re is not None:
+            replaced_href = self.apply_url_replacements(href)
+            if replaced_href != href:
+                logger.info(f"✅ Applied URL replacement: {href} → {replaced_href}")
+                href = replaced_href
+        
+        # Lowercase once and classify with a single regex match
+        href_lc = href.lower()
+        if base_url == self.base_url:
+            host, classifier, href_prefix = self._host, self._link_classifier, self._href_prefix
+        else:
+            host, classifier = _compile_link_classifier(base_url)
+            href_prefix = f"https://{base_url}/"
+        
+        match = classifier.match(href_lc)
+        link_type = match.lastgroup if match else None
+        
+        # Handle Medium profile, publication and direct post links
+        if link_type in ('profile', 'publication', 'direct'):
+            raw_post_path = match.group(link_type)
+            # Skip if a direct link looks like a Medium system path
+            if link_type == 'direct' and any(system_path in raw_post_path for system_path in _MEDIUM_SYSTEM_PATHS):
+                return href
+            clean_slug = self.clean_medium_post_slug(raw_post_path)
+            new_url = href_prefix + clean_slug + '/'
+            logger.info(f"✅ Updated Medium {link_type} link: {href} → {new_url}")
+            return new_url
+        
+        # Leave other Medium pages untouched
+        if link_type == 'medium':
+            return href
+        
+        # Handle existing domain references (could be .com, .de, .org, etc.)
+        if link_type == 'own':
+            if href.startswith(href_prefix) and '?' not in href and '#' not in href and ';' not in href:
+                # Already canonical apart from a trailing slash, no need to parse it
+                new_url = href_prefix[:-1] + href[len(href_prefix) - 1:].rstrip('/')
+                if new_url != href:
+                    logger.info(f"✅ Updated domain reference: {href} → {new_url}")
+                return new_url
+            # Clean up any www prefix and ensure correct protocol
+            parsed_url = urlparse(href)
+            clean_path = parsed_url.path.rstrip('/')
+            query_string = f"?{parsed_url.query}" if parsed_url.query else ""
+            fragment = f"#{parsed_url.fragment}" if parsed_url.fragment else ""
+            new_url = f"https://{base_url}{clean_path}{query_string}{fragment}"
+        elif host in href_lc and not href_lc.startswith('http'):
+            # Relative URL, just ensure it starts with /
+            new_url = href if href.startswith('/') else f"/{href}"
+        else:
+            return href
+        
+        if new_url != href:
+            logger.info(f"✅ Updated domain reference: {href} → {new_url}")
+        return new_url
+    
+    def process_links_in_element(self, element, base_url: str, anchors: Optional[List] = None):
         """
         Process and clean links in an HTML element.
         
         Args:
             element: BeautifulSoup element containing links
             base_url: Target base URL for internal links (without protocol, e.g., 'yourdomain.com' or 'yourdomain.de')
+            anchors: Optional pre-collected <a> tags of the element, avoids another tree walk
         """
-        for link_tag in element.find_all('a'):
+        if anchors is None:
+            anchors = [node for node in element.descendants if getattr(node, 'name', None) == 'a']
+        
+        # Phase 1: clean attributes and compute the new link targets
+        updates = []
+        for link_tag in anchors:
             # Remove Medium-specific attributes
-            attrs_to_remove = ['data-action', 'data-action-type', 'data-action-value', 
-                             'data-anchor-type', 'data-user-id', 'class', 'id', 'name']
-            for attr in attrs_to_remove:
+            for attr in _LINK_ATTRS_TO_REMOVE:
                 if link_tag.has_attr(attr):
                     del link_tag[attr]
             
             # Process href attributes
             href = link_tag.get('href')
             if href:
-                # Handle Medium profile/publication links
-                if 'medium.com/' in href:
-                    # Pattern 1: Profile posts - medium.com/@username/post-title-hash
-                    profile_match = re.search(r'medium\.com/@[^/]+/([^?/#]+)', href)
-                    # Pattern 2: Publication posts - medium.com/publication/post-title-hash  
-                    publication_match = re.search(r'medium\.com/[^/@][^/]*/([^?/#]+)', href)
-                    # Pattern 3: Direct posts - medium.com/post-title-hash
-                    direct_match = re.search(r'medium\.com/([^/@?#][^/?#]*)', href)
-                    
-                    if profile_match:
-                        raw_post_path = profile_match.group(1)
-                        clean_slug = self.clean_medium_post_slug(raw_post_path)
-                        new_url = f"https://{base_url}/{clean_slug}/"
-                        link_tag['href'] = new_url
-                        logger.info(f"✅ Updated Medium profile link: {href} → {new_url}")
-                    elif publication_match:
-                        raw_post_path = publication_match.group(1)
-                        clean_slug = self.clean_medium_post_slug(raw_post_path)
-                        new_url = f"https://{base_url}/{clean_slug}/"
-                        link_tag['href'] = new_url
-                        logger.info(f"✅ Updated Medium publication link: {href} → {new_url}")
-                    elif direct_match:
-                        raw_post_path = direct_match.group(1)
-                        # Skip if this looks like a Medium system path
-                        if not any(system_path in raw_post_path.lower() for system_path in 
-                                 ['about', 'help', 'settings', 'membership', 'partner', 'creators']):
-                            clean_slug = self.clean_medium_post_slug(raw_post_path)
-                            new_url = f"https://{base_url}/{clean_slug}/"
-                            link_tag['href'] = new_url
-                            logger.info(f"✅ Updated Medium direct link: {href} → {new_url}")
-                
-                # Handle existing domain references (could be .com, .de, .org, etc.)
-                elif any(domain_ref in href for domain_ref in [base_url, f'www.{base_url}']):
-                    # Clean up any www prefix and ensure correct protocol
-                    if href.startswith('http'):
-                        # Extract path and rebuild URL
-                        parsed_url = urlparse(href)
-                        clean_path = parsed_url.path.rstrip('/')
-                        query_string = f"?{parsed_url.query}" if parsed_url.query else ""
-                        fragment = f"#{parsed_url.fragment}" if parsed_url.fragment else ""
-                        new_url = f"https://{base_url}{clean_path}{query_string}{fragment}"
-                    else:
-                        # Relative URL, just ensure it starts with /
-                        new_url = href if href.startswith('/') else f"/{href}"
-                    
-                    if new_url != href:
-                        link_tag['href'] = new_url
-                        logger.info(f"✅ Updated domain reference: {href} → {new_url}")
+                new_href = self.rewrite_link(href, base_url)
+                if new_href != href:
+                    updates.append((link_tag, new_href))
             
             # Remove data-href attributes
             if link_tag.has_attr('data-href'):
                 del link_tag['data-href']
+        
+        # Phase 2: assign all rewritten links in one tight loop
+        for link_tag, new_href in updates:
+            link_tag.attrs['href'] = new_href
     
-    def process_content(self, content_html: str, post_slug: str) -> str:
+    def process_links_stream(self, input_path: str, output_path: str, base_url: Optional[str] = None) -> bool:
+        """
+        Rewrite the links of an HTML file without building a BeautifulSoup tree.
+        
+        Uses lxml's iterparse to visit every <a> tag as soon as it has been
+        parsed, which is considerably faster than BeautifulSoup for large files.
+        Requires lxml.
+        
+        Args:
+            input_path: Path to the HTML file to read
+            output_path: Path to write the rewritten HTML to
+            base_url: Target base URL for internal links (default: converter base URL)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            from lxml import etree
+        except ImportError:
+            logger.error("lxml is required for streaming link processing - run: pip install lxml")
+            return False
+        
+        base_url = base_url or self.base_url
+        try:
+            context = etree.iterparse(input_path, events=('end',), tag='a', html=True)
+            for _, link_tag in context:
+                self._process_lxml_link(link_tag, base_url)
+            
+            # Keep the input's doctype; libxml2 reports a default one for documents without any
+            with open(input_path, 'rb') as f:
+                has_doctype = f.read(1024).lstrip(b'\xef\xbb\xbf \t\r\n').lower().startswith(b'<!doctype')
+            if has_doctype:
+                tree = context.root.getroottree()
+                output_html = etree.tostring(tree, method='html', encoding='unicode', doctype=tree.docinfo.doctype)
+            else:
+                output_html = etree.tostring(context.root, method='html', encoding='unicode')
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(output_html)
+            return True
+        except Exception as e:
+            logger.error(f"Error processing links in {input_path}: {e}")
+            return False
+    
+    def process_links_html(self, content_html: str, base_url: Optional[str] = None) -> str:
+        """
+        Rewrite the links of an HTML fragment.
+        
+        With lxml installed, the links are found with a single XPath query on an
+        lxml tree instead of walking a BeautifulSoup tree.
+        
+        Args:
+            content_html: HTML fragment whose links should be rewritten
+            base_url: Target base URL for internal links (default: converter base URL)
+            
+        Returns:
+            HTML fragment with rewritten links
+        """
+        base_url = base_url or self.base_url
+        try:
+            from lxml import etree, html as lxml_html
+        except ImportError:
+            soup = BeautifulSoup(content_html, _PARSER)
+            self.process_links_in_element(soup, base_url)
+            return str(soup)
+        
+        root = lxml_html.fragment_fromstring(content_html, create_parent='div')
+        for link_tag in _ANCHOR_XPATH(root):
+            self._process_lxml_link(link_tag, base_url)
+        # The leading text is not part of any child, so it has to be escaped by hand
+        return html.escape(root.text or '', quote=False) + ''.join(
+            etree.tostring(child, method='html', encoding='unicode') for child in root)
+    
+    def _process_lxml_link(self, link_tag, base_url: str):
+        """
+        Clean and rewrite a single lxml <a> element in place.
+        
+        Args:
+            link_tag: lxml element of the link
+            base_url: Target base URL for internal links
+        """
+        for attr in _LINK_ATTRS_TO_REMOVE + ('data-href',):
+            link_tag.attrib.pop(attr, None)
+        
+        href = link_tag.get('href')
+        if href:
+            new_href = self.rewrite_link(href, base_url)
+            if new_href != href:
+                link_tag.set('href', new_href)
+    
+    def process_content(self, content_html: Union[str, Tag], post_slug: str) -> str:
         """
         Process and clean HTML content from Medium format.
         
         Args:
-            content_html: Raw HTML content from Medium
+            content_html: Raw HTML content from Medium, or an already parsed element
+                (which is cleaned in place)
             post_slug: Post slug for image naming
             
         Returns:
             Cleaned HTML content for WordPress
         """
-        soup = BeautifulSoup(content_html, 'html.parser')
+        if isinstance(content_html, Tag):
+            soup = content_html
+        else:
+            soup = BeautifulSoup(content_html, _PARSER)
         content_parts = []
+        # Pending images as (index in content_parts, url, filename, path, img attributes)
+        downloads = []
+        # Downloads running in the background while the rest of the post is processed
+        running: Dict[str, Future] = {}
         
         # Find all content elements in order
         elements = soup.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'figure', 
@@ -257,49 +825,38 @@ class MediumToWordPressConverter:
                 img_tag = element.find('img')
                 if img_tag:
                     src = img_tag.get('src')
-                    if src and 'medium.com' in src:
-                        if self.download_images:
-                            # Download and process image
-                            image_filename = self.get_image_filename(src, post_slug)
-                            image_path = os.path.join(self.images_dir, image_filename)
-                            
-                            if self.download_image(src, image_path):
-                                # Create WordPress-compatible image path
-                                current_year = datetime.now().year
-                                current_month = datetime.now().strftime('%m')
-                                src = f"/wp-content/uploads/{current_year}/{current_month}/{image_filename}"
-                                logger.info(f"✅ Downloaded image: {image_filename}")
-                            else:
-                                logger.warning(f"❌ Could not download image: {src}")
                     
-                    # Create clean figure element
-                    figure_html = '<figure><img'
-                    if img_tag.get('data-width'):
-                        figure_html += f' data-width="{img_tag["data-width"]}"'
-                    if img_tag.get('data-height'):
-                        figure_html += f' data-height="{img_tag["data-height"]}"'
-                    if img_tag.get('alt'):
-                        figure_html += f' alt="{html.escape(img_tag["alt"])}"'
-                    figure_html += f' src="{src}"></figure>'
+                    # Collect the attributes of the clean figure element
+                    img_attrs = []
+                    width = img_tag.get('data-width')
+                    if width:
+                        img_attrs.append(f'data-width="{width}"')
+                    height = img_tag.get('data-height')
+                    if height:
+                        img_attrs.append(f'data-height="{height}"')
+                    alt = img_tag.get('alt')
+                    if alt:
+                        img_attrs.append(f'alt="{html.escape(alt)}"')
                     
-                    content_parts.append(figure_html)
+                    if src and 'medium.com' in src and self.download_images:
+                        # Start the download right away; its src is swapped in once all downloads finished
+                        image_filename = self.get_image_filename(src, post_slug)
+                        image_path = os.path.join(self.images_dir, image_filename)
+                        downloads.append((len(content_parts), src, image_filename, image_path, img_attrs))
+                        self._start_image_download(src, image_path, running)
+                    
+                    content_parts.append(_figure_html(img_attrs, src))
             
             elif element.name in ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                # Process text elements
-                element_copy = BeautifulSoup(str(element), 'html.parser').find(element.name)
-                
-                # Remove CSS classes and IDs
-                for tag in element_copy.find_all(True):
-                    attrs_to_remove = ['class', 'id', 'name']
-                    for attr in attrs_to_remove:
-                        if tag.has_attr(attr):
-                            del tag[attr]
-                
-                # Process links
-                self.process_links_in_element(element_copy, self.base_url)
-                
-                # Get cleaned content
-                inner_html = element_copy.decode_contents()
+                if all(type(child) is NavigableString for child in element.contents):
+                    # Plain text needs no cleanup, so skip the tree walk and escape it directly
+                    inner_html = html.escape(''.join(element.contents), quote=False)
+                else:
+                    # Process text elements in place, the tree is not reused afterwards
+                    self._clean_tree(element, self.base_url)
+                    
+                    # Get cleaned content
+                    inner_html = element.decode_contents()
                 if inner_html.strip():
                     content_parts.append(f'<{element.name}>{inner_html}</{element.name}>')
             
@@ -331,8 +888,145 @@ class MediumToWordPressConverter:
             elif element.name == 'hr':
                 content_parts.append('<hr>')
         
+        if downloads:
+            self._download_post_images(downloads, content_parts, running)
+        
         return ''.join(content_parts)
     
+    def _clean_tree(self, element: Tag, base_url: str) -> None:
+        """
+        Remove CSS classes and IDs below an element and process its links in a single walk.
+        
+        Args:
+            element: BeautifulSoup element to clean in place
+            base_url: Target base URL for internal links
+        """
+        anchors = []
+        for tag in element.find_all(True):
+            for attr in _STYLE_ATTRS_TO_REMOVE:
+                if attr in tag.attrs:
+                    del tag.attrs[attr]
+            if tag.name == 'a':
+                anchors.append(tag)
+        
+        # The links were collected on the way, so link processing needs no walk of its own
+        self.process_links_in_element(element, base_url, anchors=anchors)
+    
+    def _start_image_download(self, src: str, image_path: str, running: Dict[str, Future]) -> None:
+        """
+        Download an image in the background unless it is already known or on its way.
+        
+        Every target path is fetched only once, so no two threads write the same
+        file, and images an earlier post or run downloaded are skipped.
+        
+        Args:
+            src: Image URL
+            image_path: Local path to save the image
+            running: Downloads of the current post by path, updated in place
+        """
+        if image_path in running or _url_key(src) in self._load_url_cache():
+            return
+        if self._download_executor is None:
+            self._download_executor = ThreadPoolExecutor(max_workers=self._download_threads)
+        running[image_path] = self._download_executor.submit(self.download_image, src, image_path)
+    
+    def _download_post_images(self, downloads: List[Tuple[int, str, str, str, List[str]]],
+                              content_parts: List[str], running: Dict[str, Future]) -> None:
+        """
+        Wait for the images of a post and point their figures at the uploads path.
+        
+        Args:
+            downloads: Pending images as (index in content_parts, url, filename, path, img attributes)
+            content_parts: Processed content fragments, updated in place
+            running: Downloads started by _start_image_download, by path
+        """
+        downloaded = self._load_url_cache()
+        keys = {src: _url_key(src) for _, src, _, _, _ in downloads}
+        
+        added = {}
+        for _, src, image_filename, image_path, _ in downloads:
+            download = running.get(image_path)
+            if download is not None and download.result() and keys[src] not in downloaded:
+                added[keys[src]] = downloaded[keys[src]] = image_filename
+        if added:
+            self._save_url_cache(added)
+        
+        # WordPress-compatible upload folder, determined once for all images of the post
+        year_month = datetime.now().strftime('%Y/%m')
+        for index, src, _, _, img_attrs in downloads:
+            image_filename = downloaded.get(keys[src])
+            if image_filename:
+                # Images of earlier posts or runs were not fetched again
+                if keys[src] in added:
+                    logger.info(f"✅ Downloaded image: {image_filename}")
+                else:
+                    logger.debug(f"Reusing cached image: {image_filename}")
+                src = f"/wp-content/uploads/{year_month}/{image_filename}"
+                content_parts[index] = _figure_html(img_attrs, src)
+            else:
+                logger.warning(f"❌ Could not download image: {src}")
+    
+    def _load_url_cache(self) -> Dict[str, str]:
+        """
+        Load the downloaded image filenames of earlier runs once.
+        
+        Entries whose image is no longer in the images directory are dropped.
+        
+        Returns:
+            Image filenames by URL digest
+        """
+        if self._downloaded_urls is None:
+            cached = _read_url_cache(os.path.join(self.images_dir, _URL_CACHE_FILE))
+            self._downloaded_urls = {
+                key: filename for key, filename in cached.items()
+                if os.path.exists(os.path.join(self.images_dir, filename))
+            }
+        return self._downloaded_urls
+    
+    def _save_url_cache(self, added: Dict[str, str]):
+        """
+        Merge newly downloaded images into the cache file of the images directory.
+        
+        Worker processes update the file one at a time under a lock file, and
+        the file is re-read inside the lock, so entries added by other workers
+        in the meantime are kept.
+        
+        Args:
+            added: New image filenames by URL digest
+        """
+        cache_path = os.path.join(self.images_dir, _URL_CACHE_FILE)
+        lock_path = f"{cache_path}.lock"
+        try:
+            deadline = time.monotonic() + _URL_CACHE_LOCK_TIMEOUT
+            while True:
+                try:
+                    lock_fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                    break
+                except FileExistsError:
+                    if time.monotonic() > deadline:
+                        # Updates take milliseconds, so this lock outlived its process
+                        logger.warning(f"Removing stale image cache lock {lock_path}")
+                        try:
+                            os.remove(lock_path)
+                        except FileNotFoundError:
+                            pass
+                        deadline = time.monotonic() + _URL_CACHE_LOCK_TIMEOUT
+                    else:
+                        time.sleep(0.01)
+            
+            try:
+                cached = _read_url_cache(cache_path)
+                cached.update(added)
+                temp_path = f"{cache_path}.{os.getpid()}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(cached, f)
+                os.replace(temp_path, cache_path)
+            finally:
+                os.close(lock_fd)
+                os.remove(lock_path)
+        except OSError as e:
+            logger.warning(f"Could not write image cache {cache_path}: {e}")
+    
     def extract_date_from_filename(self, filename: str) -> datetime:
         """
         Extract publication date from Medium filename.
@@ -344,7 +1038,7 @@ class MediumToWordPressConverter:
             Parsed datetime or current datetime as fallback
         """
         # Format: 2019-07-04_Title-hash.html
-        match = re.search(r'^(\d{4}-\d{2}-\d{2})_', filename)
+        match = _DATE_RE.search(filename)
         if match:
             date_str = match.group(1)
             try:
@@ -368,42 +1062,23 @@ class MediumToWordPressConverter:
         """
         text = f"{title} {content}".lower()
         
-        # Category mapping based on keywords
-        category_keywords = {
-            'WEB DEVELOPMENT': ['angular', 'react', 'vue', 'javascript', 'typescript', 'html', 'css', 'web', 'frontend', 'backend'],
-            '.NET': ['.net', 'c#', 'csharp', 'asp.net', 'entity framework', 'blazor', 'mvc', 'web api', 'dotnet'],
-            'DEVOPS': ['docker', 'kubernetes', 'azure', 'aws', 'deployment', 'ci/cd', 'pipeline', 'devops', 'terraform'],
-            'PROGRAMMING': ['code', 'programming', 'development', 'software', 'algorithm', 'design pattern'],
-            'CLOUD': ['azure', 'aws', 'cloud', 'serverless', 'microservices', 'container'],
-            'MOBILE': ['ionic', 'xamarin', 'mobile', 'android', 'ios', 'app development'],
-            'TUTORIAL': ['tutorial', 'guide', 'how to', 'step by step', 'getting started', 'introduction']
-        }
-        
-        # Tag keywords
-        tag_keywords = [
-            'angular', 'react', 'vue', 'javascript', 'typescript', 'html', 'css', 'sass',
-            '.net', 'c#', 'asp.net', 'blazor', 'mvc', 'web api', 'entity framework',
-            'docker', 'kubernetes', 'azure', 'aws', 'git', 'github', 'visual studio',
-            'npm', 'node.js', 'webpack', 'vite', 'ionic', 'xamarin', 'sql', 'database',
-            'api', 'rest', 'graphql', 'json', 'microservices', 'architecture',
-            'testing', 'unit testing', 'debugging', 'performance', 'security'
-        ]
-        
-        # Find matching categories
-        categories = []
-        for category, keywords in category_keywords.items():
-            if any(keyword in text for keyword in keywords):
-                categories.append(category)
+        # Collect every keyword that occurs in the text in two linear scans, keeping
+        # only known keywords instead of building a set of every word
+        found = _ALL_KEYWORDS.intersection(_WORD_RE.findall(text)).union(
+            match.group(1) for match in _KEYWORD_PHRASE_RE.finditer(text))
+        
+        # Union the categories of every matched keyword, keeping the table order
+        hits = set()
+        for keyword in found.intersection(_KEYWORD_CATEGORIES):
+            hits.update(_KEYWORD_CATEGORIES[keyword])
+        categories = [category for category in _CATEGORY_KEYWORDS if category in hits]
         
         # Default to PROGRAMMING if no specific category found
         if not categories:
             categories = ['PROGRAMMING']
         
         # Find matching tags
-        tags = []
-        for tag in tag_keywords:
-            if tag in text:
-                tags.append(tag.upper())
+        tags = [tag.upper() for tag in _TAG_KEYWORDS if tag in found]
         
         # Limit results
         return categories[:2], tags[:5]
@@ -416,14 +1091,15 @@ class MediumToWordPressConverter:
             title: Post title
             content: Post content (HTML)
             date: Publication date
-            post_id: Unique post ID
+            post_id: Unique post ID (default: CRC32 of the title)
             
         Returns:
             WordPress XML item string
         """
         post_slug = self.create_slug(title)
         if post_id is None:
-            post_id = abs(hash(title)) % 100000
+            # Deterministic across runs, unlike the per-process randomized hash()
+            post_id = zlib.crc32(title.encode('utf-8'))
         
         # WordPress-compatible date formatting
         wp_date = date.strftime('%Y-%m-%d %H:%M:%S')
@@ -433,26 +1109,28 @@ class MediumToWordPressConverter:
         categories, tags = self.extract_categories_and_tags(title, content)
         
         # Build category XML
-        category_xml = ""
+        category_parts = []
         for category in categories:
             category_slug = self.create_slug(category)
-            category_xml += f'\n\t\t<category domain="category" nicename="{category_slug}"><![CDATA[{category}]]></category>'
+            category_parts.append(f'\n\t\t<category domain="category" nicename="{category_slug}"><![CDATA[{category}]]></category>')
+        category_xml = ''.join(category_parts)
         
         # Build tag XML
-        tag_xml = ""
+        tag_parts = []
         for tag in tags:
-            tag_slug = tag.replace(' ', '-').replace('.', '').replace('#', '').lower()
-            tag_xml += f'\n\t\t<category domain="post_tag" nicename="{tag_slug}"><![CDATA[{tag}]]></category>'
+            tag_slug = tag.translate(_TAG_SLUG_TRANS).lower()
+            tag_parts.append(f'\n\t\t<category domain="post_tag" nicename="{tag_slug}"><![CDATA[{tag}]]></category>')
+        tag_xml = ''.join(tag_parts)
         
         return f"""
 	<item>
-		<title><![CDATA[{title}]]></title>
+		<title><![CDATA[{_cdata_escape(title)}]]></title>
 		<link>https://{self.base_url}/{post_slug}/</link>
 		<pubDate>{pub_date}</pubDate>
 		<dc:creator><![CDATA[Admin]]></dc:creator>
 		<guid isPermaLink="false">https://{self.base_url}/?p={post_id}</guid>
 		<description></description>
-		<content:encoded><![CDATA[{content}]]></content:encoded>
+		<content:encoded><![CDATA[{_cdata_escape(content)}]]></content:encoded>
 		<excerpt:encoded><![CDATA[]]></excerpt:encoded>
 		<wp:post_id>{post_id}</wp:post_id>
 		<wp:post_date><![CDATA[{wp_date}]]></wp:post_date>
@@ -480,6 +1158,15 @@ class MediumToWordPressConverter:
         Returns:
             Complete WordPress XML export
         """
+        return self.build_wp_xml_header() + "".join(items) + self.build_wp_xml_footer()
+    
+    def build_wp_xml_header(self) -> str:
+        """
+        Build the WordPress XML export up to and including the channel metadata.
+        
+        Returns:
+            XML header preceding the items
+        """
         return f"""<?xml version="1.0" encoding="UTF-8" ?>
 <!-- This is a WordPress eXtended RSS file generated by Medium to WordPress Converter -->
 <!-- It contains information about your site's posts, categories, and other content -->
@@ -568,23 +1255,72 @@ class MediumToWordPressConverter:
 	</wp:category>
 
 	<generator>Medium to WordPress Converter</generator>
-{"".join(items)}
+"""
+    
+    def build_wp_xml_footer(self) -> str:
+        """
+        Build the end of the WordPress XML export following the items.
+        
+        Returns:
+            XML footer closing the channel
+        """
+        return """
 </channel>
 </rss>"""
     
-    def parse_medium_html(self, file_path: str) -> Optional[Tuple[str, str]]:
+    def write_wp_header(self, fh: TextIO) -> None:
         """
-        Parse a Medium HTML export file.
+        Write the WordPress XML header to an open text file.
+        
+        Args:
+            fh: File the export is written to
+        """
+        fh.write(self.build_wp_xml_header())
+    
+    def write_wp_footer(self, fh: TextIO) -> None:
+        """
+        Write the WordPress XML footer to an open text file.
+        
+        Args:
+            fh: File the export is written to
+        """
+        fh.write(self.build_wp_xml_footer())
+    
+    def _parse_medium_document(self, file_path: str, consume: bool = False) -> Optional[Tuple[str, Tag]]:
+        """
+        Parse a Medium HTML export file into its title and body element.
+        
+        The title and body HTML of parsed documents are cached per path and
+        reused while the file's modification time and size are unchanged, so
+        listing the posts and converting them afterwards in this process reads
+        every file only once. Only the body section is re-parsed on a cache hit;
+        the cache keeps at most _PARSE_CACHE_SIZE documents.
         
         Args:
             file_path: Path to Medium HTML file
+            consume: Take the document out of the cache, for callers that convert it once
             
         Returns:
-            Tuple of (title, content_html) or None if parsing failed
+            Tuple of (title, body section element) or None if parsing failed
         """
         try:
+            stat = os.stat(file_path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            
+            cached = self._parse_cache.pop(file_path, None) if consume else self._parse_cache.get(file_path)
+            if cached and cached[0] == stamp:
+                title, body_html = cached[1]
+                soup = BeautifulSoup(body_html, _PARSER, parse_only=_BODY_STRAINER)
+                return title, soup.find('section', {'data-field': 'body'})
+            
             with open(file_path, 'r', encoding='utf-8') as f:
-                soup = BeautifulSoup(f.read(), 'html.parser')
+                raw_html = f.read()
+                # Skip the head with Medium's inline stylesheet, identical in every export,
+                # before it reaches the tokenizer
+                body_start = raw_html.find('<body')
+                if body_start > 0:
+                    raw_html = raw_html[body_start:]
+                soup = BeautifulSoup(raw_html, _PARSER, parse_only=_DOCUMENT_STRAINER)
                 
                 title_tag = soup.find('h1')
                 body_section = soup.find('section', {'data-field': 'body'})
@@ -593,14 +1329,45 @@ class MediumToWordPressConverter:
                     logger.error(f"Could not find title or body in {file_path}")
                     return None
                 
-                title = title_tag.get_text().strip()
-                content_html = str(body_section)
-                
-                return title, content_html
+                result = title_tag.get_text().strip(), body_section
+                if not consume:
+                    if len(self._parse_cache) >= _PARSE_CACHE_SIZE:
+                        del self._parse_cache[next(iter(self._parse_cache))]
+                    self._parse_cache[file_path] = (stamp, (result[0], str(body_section)))
+                return result
         except Exception as e:
             logger.error(f"Error parsing {file_path}: {e}")
             return None
     
+    def parse_medium_html(self, file_path: str) -> Optional[Tuple[str, str]]:
+        """
+        Parse a Medium HTML export file.
+        
+        Args:
+            file_path: Path to Medium HTML file
+            
+        Returns:
+            Tuple of (title, content_html) or None if parsing failed
+        """
+        result = self._parse_medium_document(file_path)
+        if not result:
+            return None
+        
+        title, body_section = result
+        return title, str(body_section)
+    
+    def report(self, lines: List[str], stream=None):
+        """
+        Write report lines to a stream with a single write call.
+        
+        Args:
+            lines: Lines to write, without trailing newlines
+            stream: Output stream (default: sys.stdout)
+        """
+        if stream is None:
+            stream = sys.stdout
+        stream.write('\n'.join(lines) + '\n')
+    
     def list_available_posts(self, folder_path: str) -> List[str]:
         """
         List all available HTML files with their titles.
@@ -611,31 +1378,128 @@ class MediumToWordPressConverter:
         Returns:
             List of HTML filenames
         """
-        if not os.path.exists(folder_path):
+        try:
+            html_entries = _scan_html_files(folder_path)
+        except (FileNotFoundError, NotADirectoryError):
             logger.error(f"Folder not found: {folder_path}")
             return []
+        html_files = [entry.name for entry in html_entries]
         
-        print("📋 Available Blog Posts:")
-        print("=" * 60)
-        
-        html_files = [f for f in os.listdir(folder_path) if f.endswith('.html')]
-        html_files.sort()
-        
-        for i, file_name in enumerate(html_files, 1):
-            file_path = os.path.join(folder_path, file_name)
-            result = self.parse_medium_html(file_path)
+        lines = ["📋 Available Blog Posts:", "=" * 60]
+        for i, entry in enumerate(html_entries, 1):
+            result = self._parse_medium_document(entry.path)
             if result:
                 title, _ = result
-                print(f"{i:2d}. {title}")
-                print(f"    📁 {file_name}")
+                lines.append(f"{i:2d}. {title}")
             else:
-                print(f"{i:2d}. ❌ Could not parse")
-                print(f"    📁 {file_name}")
-            print()
+                lines.append(f"{i:2d}. ❌ Could not parse")
+            lines.append(f"    📁 {entry.name}")
+            lines.append("")
         
-        print(f"Total: {len(html_files)} HTML files found")
+        lines.append(f"Total: {len(html_files)} HTML files found")
+        self.report(lines)
         return html_files
     
+    def _convert_post(self, file_path: str, post_id: Optional[int] = None,
+                      date: Optional[datetime] = None) -> Optional[Tuple[str, str]]:
+        """
+        Run the conversion pipeline for one Medium HTML file.
+        
+        Args:
+            file_path: Path to Medium HTML file
+            post_id: WordPress post ID (default: derived from the title)
+            date: Publication date (default: extracted from the filename)
+            
+        Returns:
+            Tuple of (title, WordPress XML item) or None if parsing failed
+        """
+        logger.info(f"🔄 Processing: {os.path.basename(file_path)}")
+        # The body is cleaned in place below, so it must not stay in the parse cache
+        result = self._parse_medium_document(file_path, consume=True)
+        if not result:
+            return None
+        
+        title, body_section = result
+        post_slug = self.create_slug(title)
+        
+        # Process the parsed body directly instead of serializing and re-parsing it
+        content = self.process_content(body_section, post_slug)
+        
+        # Extract date from filename
+        if date is None:
+            date = self.extract_date_from_filename(os.path.basename(file_path))
+        
+        return title, self.build_wp_item(title, content, date, post_id)
+    
+    def convert_many(self, file_paths: List[str], workers: Optional[int] = None,
+                     post_ids: Optional[List[int]] = None) -> List[Optional[Tuple[str, str]]]:
+        """
+        Convert several Medium HTML files, in worker processes if workers > 1.
+        
+        Args:
+            file_paths: Paths to Medium HTML files
+            workers: Number of worker processes (default: convert in this process)
+            post_ids: WordPress post IDs matching file_paths (default: derived from the titles)
+            
+        Returns:
+            List of (title, WordPress XML item) tuples, None for files that failed
+        """
+        return list(self.iter_convert(file_paths, workers, post_ids))
+    
+    def iter_convert(self, file_paths: List[str], workers: Optional[int] = None,
+                     post_ids: Optional[List[int]] = None) -> Iterator[Optional[Tuple[str, str]]]:
+        """
+        Convert several Medium HTML files, yielding each result as it is ready.
+        
+        Posts are independent of each other and parsing them is CPU-bound, so
+        with more than one worker they are processed by a pool of worker
+        processes, each running its own converter with this converter's
+        settings (a custom session is not passed on). Like any use of
+        multiprocessing, this requires an ``if __name__ == '__main__'`` guard
+        on platforms that spawn processes. Results are yielded in the order of
+        file_paths.
+        
+        Args:
+            file_paths: Paths to Medium HTML files
+            workers: Number of worker processes (default: convert in this process)
+            post_ids: WordPress post IDs matching file_paths (default: derived from the titles)
+            
+        Yields:
+            (title, WordPress XML item) tuples, None for files that failed
+        """
+        if post_ids is None:
+            post_ids = [None] * len(file_paths)
+        # Parse the dates of all filenames in one pass; posts without one fall back per file
+        dates = _dates_from_filenames([os.path.basename(file_path) for file_path in file_paths])
+        
+        if workers is None or workers <= 1 or len(file_paths) <= 1:
+            for file_path, post_id, date in zip(file_paths, post_ids, dates):
+                yield self._convert_post(file_path, post_id, date)
+            return
+        
+        # Worker processes parse the files themselves, so documents cached here would only hold memory
+        self._parse_cache.clear()
+        
+        # Every worker process downloads images with its share of the threads, so the
+        # number of concurrent requests stays the same as in a single process
+        processes = workers
+        download_threads = max(1, _IMAGE_DOWNLOAD_WORKERS // processes)
+        settings = (self.base_url, self.download_images, tuple(self.url_replacements.items()),
+                    self.max_image_width, download_threads)
+        tasks = [(file_path, post_id, date) + settings
+                 for file_path, post_id, date in zip(file_paths, post_ids, dates)]
+        
+        # Workers log through a queue so their lines are emitted whole by this process
+        log_queue = multiprocessing.Queue()
+        listener = QueueListener(log_queue, *logging.getLogger().handlers, respect_handler_level=True)
+        listener.start()
+        try:
+            with ProcessPoolExecutor(max_workers=processes,
+                                     initializer=_init_worker, initargs=(log_queue, logging.getLogger().level)) as executor:
+                yield from executor.map(_process_one, tasks, chunksize=_CONVERT_CHUNKSIZE)
+        finally:
+            listener.stop()
+    
     def convert_single_post(self, file_path: str, output_file: str) -> bool:
         """
         Convert a single Medium post to WordPress XML.
@@ -655,25 +1519,13 @@ class MediumToWordPressConverter:
             logger.error(f"File must be HTML: {file_path}")
             return False
         
-        logger.info(f"🔄 Processing: {os.path.basename(file_path)}")
-        result = self.parse_medium_html(file_path)
+        result = self._convert_post(file_path)
         
         if not result:
             logger.error(f"Could not parse HTML file: {file_path}")
             return False
         
-        title, content_html = result
-        post_slug = self.create_slug(title)
-        
-        # Process content
-        content = self.process_content(content_html, post_slug)
-        
-        # Extract date from filename
-        filename = os.path.basename(file_path)
-        date = self.extract_date_from_filename(filename)
-        post_id = abs(hash(title)) % 100000
-        
-        wp_item = self.build_wp_item(title, content, date, post_id)
+        title, wp_item = result
         full_xml = self.build_wp_xml([wp_item])
         
         try:
@@ -689,70 +1541,118 @@ class MediumToWordPressConverter:
             logger.error(f"Error writing output file {output_file}: {e}")
             return False
     
-    def convert_folder(self, folder_path: str, output_file: str) -> bool:
+    def convert_folder(self, folder_path: str, output_file: str, workers: Optional[int] = None) -> bool:
         """
         Convert all Medium posts in a folder to WordPress XML.
         
         Args:
             folder_path: Path to folder containing HTML files
             output_file: Output XML file path
+            workers: Number of posts converted in parallel (default: convert in this process)
             
         Returns:
             True if successful, False otherwise
         """
-        if not os.path.exists(folder_path):
+        try:
+            html_entries = _scan_html_files(folder_path)
+        except (FileNotFoundError, NotADirectoryError):
             logger.error(f"Folder not found: {folder_path}")
             return False
         
-        items = []
-        html_files = [f for f in os.listdir(folder_path) if f.endswith('.html')]
-        
-        if not html_files:
+        if not html_entries:
             logger.error(f"No HTML files found in {folder_path}")
             return False
         
-        for file_name in sorted(html_files):
-            logger.info(f"🔄 Processing: {file_name}")
-            file_path = os.path.join(folder_path, file_name)
-            result = self.parse_medium_html(file_path)
-            
-            if result:
-                title, content_html = result
-                post_slug = self.create_slug(title)
-                
-                # Process content
-                content = self.process_content(content_html, post_slug)
-                
-                # Extract date from filename
-                date = self.extract_date_from_filename(file_name)
-                post_id = abs(hash(title)) % 100000
-                
-                wp_item = self.build_wp_item(title, content, date, post_id)
-                items.append(wp_item)
-                logger.info(f"✅ Post processed: {title}")
-            else:
-                logger.warning(f"❌ Skipped: {file_name}")
-        
-        if not items:
-            logger.error("No posts were successfully processed")
-            return False
+        html_files = [entry.name for entry in html_entries]
+        file_paths = [entry.path for entry in html_entries]
+        # Number the posts consecutively so IDs are unique and stable between runs
+        post_ids = list(range(_FIRST_POST_ID, _FIRST_POST_ID + len(file_paths)))
         
-        # Write output
+        # Write each item as soon as it is converted, so only one post is held in memory.
+        # The export goes to a temporary file first, so a failed run never leaves a truncated file
+        temp_file = f"{output_file}.tmp"
+        exported = 0
         try:
-            full_xml = self.build_wp_xml(items)
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(full_xml)
-            
-            logger.info(f"\n🎉 Export completed!")
-            logger.info(f"📄 WordPress XML: {output_file}")
-            logger.info(f"📊 {len(items)} blog posts exported")
-            if self.download_images:
-                logger.info(f"🖼️  Images directory: {self.images_dir}")
-                logger.info(f"💡 Upload all images from '{self.images_dir}' to your WordPress Media Library")
-            return True
-        except Exception as e:
+            with open(temp_file, 'w', encoding='utf-8', buffering=_OUTPUT_BUFFER_SIZE) as f:
+                self.write_wp_header(f)
+                results = self.iter_convert(file_paths, workers, post_ids)
+                for file_name, result in zip(html_files, results):
+                    if result:
+                        title, wp_item = result
+                        f.write(wp_item)
+                        exported += 1
+                        logger.info(f"✅ Post processed: {title}")
+                    else:
+                        logger.warning(f"❌ Skipped: {file_name}")
+                self.write_wp_footer(f)
+            if exported:
+                os.replace(temp_file, output_file)
+        except OSError as e:
             logger.error(f"Error writing output file {output_file}: {e}")
             return False
+        except Exception as e:
+            logger.error(f"Error converting posts: {e}")
+            return False
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+        
+        if not exported:
+            logger.error("No posts were successfully processed")
+            return False
+        
+        logger.info(f"\n🎉 Export completed!")
+        logger.info(f"📄 WordPress XML: {output_file}")
+        logger.info(f"📊 {exported} blog posts exported")
+        if self.download_images:
+            logger.info(f"🖼️  Images directory: {self.images_dir}")
+            logger.info(f"💡 Upload all images from '{self.images_dir}' to your WordPress Media Library")
+        return True
+
+def _init_worker(log_queue: multiprocessing.Queue, level: int) -> None:
+    """Route the log records of a worker process to the parent's queue."""
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(level)
+
+
+@lru_cache(maxsize=None)
+def _worker_converter(base_url: str, download_images: bool, url_replacements: Tuple[Tuple[str, str], ...],
+                      max_image_width: Optional[int], download_threads: int) -> MediumToWordPressConverter:
+    """Create the converter of a worker process once per configuration."""
+    converter = MediumToWordPressConverter(base_url, download_images, list(url_replacements),
+                                           max_image_width=max_image_width)
+    converter._download_threads = download_threads
+    return converter
+
+
+def _process_one(task: Tuple[str, Optional[int], Optional[datetime], str, bool,
+                             Tuple[Tuple[str, str], ...], Optional[int], int]) -> Optional[Tuple[str, str]]:
+    """
+    Convert one post inside a worker process.
+    
+    Args:
+        task: Tuple of (file_path, post_id, date, base_url, download_images, url_replacements,
+            max_image_width, download_threads)
+        
+    Returns:
+        Tuple of (title, WordPress XML item) or None if parsing failed
+    """
+    (file_path, post_id, date, base_url, download_images, url_replacements,
+     max_image_width, download_threads) = task
+    converter = _worker_converter(base_url, download_images, url_replacements, max_image_width, download_threads)
+    return converter._convert_post(file_path, post_id, date)
+
+
+def _positive_int(value: str) -> int:
+    """Argparse type for options that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def main():
@@ -779,6 +1679,10 @@ Examples:
                        help='Directory containing Medium HTML exports (default: export_htmls)')
     parser.add_argument('--no-images', action='store_true',
                        help='Skip downloading images')
+    parser.add_argument('--workers', type=_positive_int, default=os.cpu_count(),
+                       help='Number of posts converted in parallel (default: number of CPUs)')
+    parser.add_argument('--max-image-width', type=_positive_int, default=None,
+                       help='Downscale downloaded images wider than this many pixels (requires Pillow)')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose logging')
     
@@ -806,15 +1710,19 @@ Examples:
     # Clean base URL
     base_url = args.base_url.replace('https://', '').replace('http://', '').strip('/')
     
+    if args.max_image_width and Image is None:
+        logger.warning("Pillow is required to downscale images - run: pip install Pillow")
+    
     # Initialize converter
     converter = MediumToWordPressConverter(
         base_url=base_url,
-        download_images=not args.no_images
+        download_images=not args.no_images,
+        max_image_width=args.max_image_width
     )
     
     if args.command == 'all':
         logger.info(f"🚀 Exporting all posts to {base_url}...")
-        success = converter.convert_folder(args.input_dir, 'wordpress_export.xml')
+        success = converter.convert_folder(args.input_dir, 'wordpress_export.xml', workers=args.workers)
         sys.exit(0 if success else 1)
     
     elif args.command == 'single':
@@ -826,20 +1734,24 @@ Examples:
         
         # Handle numeric input (post number)
         if args.target.isdigit():
-            html_files = converter.list_available_posts(args.input_dir)
+            # Scan the folder once to pick the file, without parsing every post for its title
+            try:
+                html_entries = _scan_html_files(args.input_dir)
+            except (FileNotFoundError, NotADirectoryError):
+                logger.error(f"Folder not found: {args.input_dir}")
+                html_entries = []
             post_number = int(args.target)
             
-            if 1 <= post_number <= len(html_files):
-                selected_file = html_files[post_number - 1]
-                file_path = os.path.join(args.input_dir, selected_file)
-                base_name = os.path.splitext(selected_file)[0]
+            if 1 <= post_number <= len(html_entries):
+                selected_entry = html_entries[post_number - 1]
+                base_name = os.path.splitext(selected_entry.name)[0]
                 output_file = f"{base_name}.xml"
                 
-                logger.info(f"🚀 Exporting post #{post_number}: {selected_file}")
-                success = converter.convert_single_post(file_path, output_file)
+                logger.info(f"🚀 Exporting post #{post_number}: {selected_entry.name}")
+                success = converter.convert_single_post(selected_entry.path, output_file)
             else:
                 logger.error(f"Invalid post number: {post_number}")
-                logger.error(f"Available posts: 1-{len(html_files)}")
+                logger.error(f"Available posts: 1-{len(html_entries)}")
                 success = False
         else:
             # Handle filename input
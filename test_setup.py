@@ -125,6 +125,15 @@ def test_sample_html():
             print("❌ HTML processing failed: formatting not preserved")
             return False
         
+        # Special characters must stay escaped in the output
+        escape_html = '<section data-field="body"><p>Use a &lt;div&gt; &amp; a <a href="/x?a=1&amp;b=2">link</a></p></section>'
+        processed_content = converter.process_content(escape_html, "test-post")
+        if "&lt;div&gt; &amp; a" in processed_content and 'href="/x?a=1&amp;b=2"' in processed_content:
+            print("✅ HTML processing works: special characters escaped")
+        else:
+            print(f"❌ HTML processing failed: special characters not escaped: {processed_content}")
+            return False
+        
         print("✅ HTML processing completed successfully")
         return True
     except Exception as e:
@@ -185,12 +194,22 @@ def test_link_processing():
                 print(f"❌ Slug cleaning failed: '{original}' → '{result}' (expected '{expected}')")
                 return False
         
+        # Batched slug cleaning must match the single-slug version
+        originals = [original for original, _ in test_cases]
+        batch_result = converter.clean_medium_post_slugs(originals)
+        if batch_result == [expected for _, expected in test_cases]:
+            print(f"✅ Batched slug cleaning: {batch_result}")
+        else:
+            print(f"❌ Batched slug cleaning failed: {batch_result}")
+            return False
+        
         # Test link processing with sample HTML
         sample_html = """
         <div>
             <p>Check out my <a href="https://medium.com/@username/great-post-abc123def456">other post</a>.</p>
             <p>Also see <a href="https://medium.com/publication/another-post-xyz789">this article</a>.</p>
             <p>Visit my <a href="https://www.example.de/old-link">website</a>.</p>
+            <p>Read <a href="medium.com/@username/schemeless-post-abc123def456">this one</a> too.</p>
         </div>
         """
         
@@ -227,6 +246,14 @@ def test_link_processing():
             print(f"❌ Domain reference failed: {third_link}")
             return False
         
+        # Links without a scheme are converted as well
+        fourth_link = links[3].get('href')
+        if fourth_link == "https://example.de/schemeless-post/":
+            print(f"✅ Scheme-less Medium link processed: {fourth_link}")
+        else:
+            print(f"❌ Scheme-less Medium link failed: {fourth_link}")
+            return False
+        
         print("✅ Link processing works correctly")
         return True
         
@@ -234,6 +261,131 @@ def test_link_processing():
         print(f"❌ Link processing test failed: {e}")
         return False
 
+def test_fragment_link_processing():
+    """Test link rewriting of HTML fragments and files."""
+    print("\n🔍 Testing fragment link processing...")
+    try:
+        from medium_to_wordpress_optimized import MediumToWordPressConverter
+        
+        converter = MediumToWordPressConverter("example.de", download_images=False)
+        
+        # Escaped leading text must stay escaped
+        fragment = ('a &amp; b &lt;script&gt; <a href="https://medium.com/@user/great-post-abc123def456" '
+                    'data-href="x">post</a> &lt;tail&gt;')
+        result = converter.process_links_html(fragment)
+        expected = 'a &amp; b &lt;script&gt; <a href="https://example.de/great-post/">post</a> &lt;tail&gt;'
+        if result == expected:
+            print(f"✅ Fragment links processed: {result}")
+        else:
+            print(f"❌ Fragment link processing failed: {result}")
+            return False
+        
+        # Streaming a whole file rewrites its links as well
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = os.path.join(temp_dir, "in.html")
+            output_path = os.path.join(temp_dir, "out.html")
+            with open(input_path, 'w', encoding='utf-8') as f:
+                f.write('<!DOCTYPE html><html><body><p>See <a href="https://medium.com/publication/another-post-xyz789" '
+                        'class="m">this</a> &amp; more</p></body></html>')
+            
+            if not converter.process_links_stream(input_path, output_path):
+                print("❌ Streaming link processing failed")
+                return False
+            with open(output_path, encoding='utf-8') as f:
+                streamed = f.read()
+            if not streamed.startswith('<!DOCTYPE html>'):
+                print(f"❌ Streamed doctype missing: {streamed}")
+                return False
+            if '<a href="https://example.de/another-post/">this</a> &amp; more' in streamed:
+                print("✅ Streamed links processed")
+            else:
+                print(f"❌ Streamed link processing failed: {streamed}")
+                return False
+        
+        return True
+    except Exception as e:
+        print(f"❌ Fragment link processing test failed: {e}")
+        return False
+
+def test_legacy_content_processing():
+    """Test the content processing of the legacy converter module."""
+    print("\n🔍 Testing legacy content processing...")
+    try:
+        import medium_to_wordpress
+        from bs4 import BeautifulSoup
+        
+        # A single top-level element is kept
+        result = medium_to_wordpress.process_content_simple(
+            '<p>Only <a href="https://www.marius-schroeder.de/post" class="x">link</a></p>',
+            "post", "wordpress_images", "example.de")
+        if result == '<p>Only <a href=https://example.de/post>link</a></p>':
+            print(f"✅ Single-root content processed: {result}")
+        else:
+            print(f"❌ Single-root content failed: {result}")
+            return False
+        
+        # Empty content yields an empty post body
+        if medium_to_wordpress.process_content_simple("  ", "post", "wordpress_images", "example.de") == '':
+            print("✅ Empty content processed")
+        else:
+            print("❌ Empty content failed")
+            return False
+        
+        # BeautifulSoup elements are still accepted by the link helper
+        soup = BeautifulSoup('<div><a href="https://medium.com/@mariusschroeder/my-post" '
+                             'data-href="x">post</a></div>', 'html.parser')
+        medium_to_wordpress.process_links_in_element(soup.div, "example.de")
+        if str(soup.a) == '<a href="https://example.de/my-post">post</a>':
+            print(f"✅ BeautifulSoup links processed: {soup.a}")
+        else:
+            print(f"❌ BeautifulSoup link processing failed: {soup.a}")
+            return False
+        
+        return True
+    except Exception as e:
+        print(f"❌ Legacy content processing test failed: {e}")
+        return False
+
+def test_keyword_matching():
+    """Test that keyword detection matches whole words and phrases."""
+    print("\n🔍 Testing keyword matching...")
+    try:
+        from medium_to_wordpress_optimized import MediumToWordPressConverter
+        
+        converter = MediumToWordPressConverter("test-domain.com", download_images=False)
+        
+        # Phrases and punctuated keywords are still found
+        categories, tags = converter.extract_categories_and_tags(
+            "Building a Web API", "A guide to ASP.NET and C# with unit testing")
+        if ".NET" in categories and "WEB API" in tags and "C#" in tags:
+            print(f"✅ Phrase keywords found: {categories} {tags}")
+        else:
+            print(f"❌ Phrase keywords missing: {categories} {tags}")
+            return False
+        
+        # Keywords hidden inside other words are ignored
+        categories, tags = converter.extract_categories_and_tags(
+            "Digital scenarios", "An interesting story")
+        if categories == ["PROGRAMMING"] and not tags:
+            print("✅ Partial word matches ignored")
+        else:
+            print(f"❌ Partial word matches found: {categories} {tags}")
+            return False
+        
+        # Phrases hidden inside other words are ignored as well
+        categories, tags = converter.extract_categories_and_tags(
+            "Somehow tomorrow", "Visit example.network or abc#")
+        if categories == ["PROGRAMMING"] and not tags:
+            print("✅ Partial phrase matches ignored")
+        else:
+            print(f"❌ Partial phrase matches found: {categories} {tags}")
+            return False
+        
+        return True
+    except Exception as e:
+        print(f"❌ Keyword matching test failed: {e}")
+        return False
+
 def main():
     """Run all tests."""
     print("🚀 Medium to WordPress Converter - Setup Test")
@@ -245,6 +397,9 @@ def main():
         ("Basic Functionality", test_basic_functionality),
         ("HTML Processing", test_sample_html),
         ("Link Processing", test_link_processing),
+        ("Fragment Link Processing", test_fragment_link_processing),
+        ("Legacy Content Processing", test_legacy_content_processing),
+        ("Keyword Matching", test_keyword_matching),
         ("Directory Setup", test_directories),
     ]
     